@@ -3,9 +3,12 @@
 Convert cooking.json to JSONL format with required structure.
 """
 
+import itertools
 import json
-import uuid
+import multiprocessing
+import os
 import re
+import string
 import argparse
 from typing import Dict, List, Any
 from urllib.parse import urlparse
@@ -17,69 +20,164 @@ except ImportError:
     LANGDETECT_AVAILABLE = False
     print("Warning: langdetect not available. Install with: pip install langdetect")
 
+# Prefer fastText's compressed LID model (C++, orders of magnitude faster than
+# the pure-Python langdetect classifier). Install with: pip install fasttext
+# and download lid.176.ftz; point FASTTEXT_LID_MODEL at it if not in cwd.
+_LID = None
+try:
+    import fasttext
+    _lid_path = os.environ.get('FASTTEXT_LID_MODEL', 'lid.176.ftz')
+    if os.path.exists(_lid_path):
+        _LID = fasttext.load_model(_lid_path)
+except ImportError:
+    pass
+
+# orjson (Rust) serializes/deserializes several times faster than stdlib json
+# and emits UTF-8 bytes directly. Install with: pip install orjson
+try:
+    import orjson
+
+    def _dumps_line(obj) -> bytes:
+        return orjson.dumps(obj) + b'\n'
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps_line(obj) -> bytes:
+        return (json.dumps(obj, ensure_ascii=False) + '\n').encode('utf-8')
+
+    _loads = json.loads
+
+# Stream-parse the input array with ijson when available so only one thread
+# dict is resident at a time (json.load holds the whole file in memory).
+# Install with: pip install ijson
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Prefer google-re2 (linear-time DFA engine) for the bulk-cleaning patterns;
+# fall back to the stdlib backtracking engine. Our patterns use no backrefs
+# or lookarounds, so re2 is a drop-in. Install with: pip install google-re2
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+# Precompiled patterns so each clean_text call walks the string once per pass
+# instead of re-dispatching seven re.sub calls. The removal classes (u/ mentions,
+# URLs, www. links, emails, phone numbers) are fused into one alternation.
+_RE_JUNK = _re_engine.compile(
+    r'u/[a-zA-Z0-9_-]+'
+    r'|https?://[^\s]+'
+    r'|www\.[^\s]+'
+    r'|\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+    r'|(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}'
+)
+# Emojis/stickers and other unusual symbols. Stays on stdlib re even when
+# re2 is installed: RE2's \w is ASCII-only, which would blank every accented
+# letter; stdlib \w is Unicode-aware and keeps them.
+_RE_SYM = re.compile(r'[^\w\s.,!?;:()\-\[\]{}"\']')
+
+# ASCII fast path for the symbol class: a prebuilt translation table runs
+# entirely in C, several times faster than the regex. Non-ASCII text still
+# needs the regex (stdlib \w covers accented letters etc.).
+_KEEP = set(string.ascii_letters + string.digits + '_' + '.,!?;:()-[]{}"\'')
+_TRANS = {cp: (cp if chr(cp) in _KEEP or chr(cp).isspace() else ord(' '))
+          for cp in range(0x80)}
+
+def _strip_symbols(text: str) -> str:
+    if text.isascii():
+        return text.translate(_TRANS)
+    return _RE_SYM.sub(' ', text)
+
 def clean_text(text: str) -> str:
     """
     Clean text by removing stickers, unusual symbols, u/ mentions, URLs, emails, and phone numbers.
     """
     if not text:
         return ""
-    
-    # Remove u/ mentions
-    text = re.sub(r'u/[a-zA-Z0-9_-]+', '', text)
-    
-    # Remove URLs (http and https)
-    text = re.sub(r'https?://[^\s]+', '', text)
-    
-    # Remove www. URLs
-    text = re.sub(r'www\.[^\s]+', '', text)
-    
-    # Remove email addresses
-    text = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '', text)
-    
-    # Remove phone numbers (various formats)
-    text = re.sub(r'(\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}', '', text)
-    
-    # Remove common stickers/emojis and unusual symbols
+
+    # Remove u/ mentions, URLs, emails and phone numbers in one pass
+    text = _RE_JUNK.sub('', text)
+
     # Remove emojis and other symbols
-    text = re.sub(r'[^\w\s.,!?;:()\-\[\]{}"\']', ' ', text)
-    
-    # Clean up multiple spaces and newlines
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
-    
-    return text
+    text = _strip_symbols(text)
+
+    # Clean up multiple spaces and newlines: split/join collapses all
+    # whitespace runs in one C-level pass, no regex needed
+    return ' '.join(text.split())
+
+# Field separator for clean_fields: \x1e (record separator) survives both
+# cleaning passes — it falls in \s, so _RE_SYM keeps it and the junk patterns
+# stop at it. Doubled so the phone pattern's optional [-.\s] gap cannot
+# bridge two fields.
+_SEP = '\x1e\x1e'
+
+def clean_fields(*parts: str) -> List[str]:
+    """
+    Clean several fields in one pass: join with a sentinel, run the junk and
+    symbol passes once over the combined buffer, then split back. One string
+    traversal per pattern instead of one per field.
+    """
+    joined = _SEP.join(p or '' for p in parts)
+    joined = _RE_JUNK.sub('', joined)
+    joined = _strip_symbols(joined)
+    fields = joined.split(_SEP)
+    if len(fields) != len(parts):
+        # A pattern consumed a sentinel; fall back to per-field cleaning
+        return [clean_text(p) for p in parts]
+    return [' '.join(f.split()) for f in fields]
 
 def detect_language(text: str) -> str:
     """
     Detect language of the text.
     """
-    if not LANGDETECT_AVAILABLE or not text.strip():
+    if not text.strip():
         return "en"  # Default to English
-    
+
+    # Use first 1000 characters for language detection to avoid issues with very long texts
+    sample_text = text[:1000] if len(text) > 1000 else text
+
+    if _LID is not None:
+        try:
+            labels, _ = _LID.predict(sample_text.replace('\n', ' '), k=1)
+            return labels[0][len('__label__'):]
+        except Exception:
+            pass
+
+    if not LANGDETECT_AVAILABLE:
+        return "en"  # Default to English
+
     try:
-        # Use first 1000 characters for language detection to avoid issues with very long texts
-        sample_text = text[:1000] if len(text) > 1000 else text
         return detect(sample_text)
     except:
         return "en"  # Default to English if detection fails
 
+def _init_worker():
+    """
+    Pool initializer: run one detection so each worker loads its language
+    model (langdetect profiles / fastText) up front instead of lazily on the
+    first real entry it processes.
+    """
+    detect_language("warm up the language detector")
+
 def extract_subreddit_from_url(url: str) -> str:
     """
     Extract subreddit name from Reddit URL.
     """
     if not url:
         return "Cooking"  # Default
-    
-    # Handle both full URLs and relative paths
-    if url.startswith('/r/'):
-        parts = url.split('/')
-        if len(parts) >= 3:
-            return parts[2]  # Extract subreddit name
-    elif 'reddit.com/r/' in url:
-        match = re.search(r'/r/([^/]+)/', url)
-        if match:
-            return match.group(1)
-    
+
+    # Pure str.find/slice: handles both full URLs and relative paths without
+    # dispatching through the regex engine
+    i = url.find('/r/')
+    if i >= 0:
+        j = url.find('/', i + 3)
+        name = url[i + 3:j] if j > 0 else url[i + 3:]
+        if name:
+            return name
+
     return "Cooking"  # Default fallback
 
 def build_full_url(url: str) -> str:
@@ -96,40 +194,69 @@ def build_full_url(url: str) -> str:
     else:
         return f"https://www.reddit.com{url}"
 
-def collect_all_replies(comments: List[Dict], replies_text: List[str] = None) -> str:
+def collect_all_replies(comments: List[Dict]) -> str:
     """
-    Recursively collect all reply bodies from comments.
+    Collect all reply bodies from comments (depth-first).
+
+    Iterative with an explicit stack: avoids per-node call frames and
+    recursion-limit failures on deeply nested threads.
     """
-    if replies_text is None:
-        replies_text = []
-    
-    for comment in comments:
-        if 'body' in comment and comment['body']:
-            replies_text.append(comment['body'])
-        
-        if 'replies' in comment and comment['replies']:
-            collect_all_replies(comment['replies'], replies_text)
-    
+    replies_text = []
+    stack = list(reversed(comments))
+    while stack:
+        comment = stack.pop()
+        body = comment.get('body')
+        if body:
+            replies_text.append(body)
+        replies = comment.get('replies')
+        if replies:
+            stack.extend(reversed(replies))
+
     return ' '.join(replies_text)
 
+class UUIDGen:
+    """
+    Batched uuid4 strings: one os.urandom call per `n` ids instead of one
+    syscall plus UUID-object construction per entry. Output keeps the standard
+    dashed uuid4 form (version/variant bits set as in RFC 4122).
+    """
+    def __init__(self, n: int = 4096):
+        self.n = n
+        self.buf = b''
+        self.i = n
+        self.pid = os.getpid()
+
+    def __call__(self) -> str:
+        # Refill after fork too, so pool workers never share a buffer
+        if self.i >= self.n or os.getpid() != self.pid:
+            self.buf = os.urandom(16 * self.n)
+            self.i = 0
+            self.pid = os.getpid()
+
+        off = 16 * self.i
+        self.i += 1
+        raw = bytearray(self.buf[off:off + 16])
+        raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+        raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+        h = raw.hex()
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+_uuid4 = UUIDGen()
+
 def convert_thread_to_jsonl_entry(thread: Dict[str, Any]) -> Dict[str, str]:
     """
     Convert a single thread to the required JSONL format.
     """
     # Generate UUID
-    thread_id = str(uuid.uuid4())
-    
-    # Extract and clean thread title
-    thread_title = clean_text(thread.get('title', ''))
-    
-    # Extract and clean thread body
-    thread_body = clean_text(thread.get('body', ''))
-    
-    # Collect and clean all replies
-    replies_body = ""
+    thread_id = _uuid4()
+
+    # Collect all replies, then clean title/body/replies in one combined pass
+    all_replies = ""
     if 'comments' in thread and thread['comments']:
         all_replies = collect_all_replies(thread['comments'])
-        replies_body = clean_text(all_replies)
+
+    thread_title, thread_body, replies_body = clean_fields(
+        thread.get('title', ''), thread.get('body', ''), all_replies)
     
     # Process URL
     url_path = thread.get('url', '')
@@ -153,48 +280,110 @@ def convert_thread_to_jsonl_entry(thread: Dict[str, Any]) -> Dict[str, str]:
         "subreddit": subreddit
     }
 
-def convert_json_to_jsonl(input_file: str, output_file: str, max_entries: int = None):
+def _convert_thread_safe(thread: Dict[str, Any]):
+    """
+    Pool worker wrapper: convert one thread, returning None on failure so a
+    malformed entry is skipped (as on the serial path) instead of the
+    exception propagating and aborting the whole pool run.
+    """
+    try:
+        return convert_thread_to_jsonl_entry(thread)
+    except Exception as e:
+        print(f"Error processing entry: {e}")
+        return None
+
+# Output write-buffer size: batch serialized entries into ~1 MiB writes
+_WRITE_BUF_SIZE = 1 << 20
+
+def iter_input_threads(input_file: str, max_entries: int = None):
+    """
+    Yield thread dicts from the input JSON array.
+
+    Uses ijson to stream the array when available, so only one thread dict is
+    resident at a time; falls back to json.load (whole file in memory).
+    """
+    if IJSON_AVAILABLE:
+        with open(input_file, 'rb') as f:
+            yield from itertools.islice(ijson.items(f, 'item'), max_entries)
+    else:
+        with open(input_file, 'rb') as f:
+            data = _loads(f.read())
+
+        if not isinstance(data, list):
+            raise ValueError("Input JSON must be an array of objects")
+
+        yield from itertools.islice(data, max_entries)
+
+def convert_json_to_jsonl(input_file: str, output_file: str, max_entries: int = None,
+                          num_proc: int = None):
     """
     Convert JSON file to JSONL format.
+
+    The per-entry cleaning/langdetect work is CPU-bound and independent, so it is
+    sharded across a multiprocessing.Pool; the main process handles all writing.
     """
     print(f"Reading {input_file}...")
-    
-    with open(input_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    if not isinstance(data, list):
-        raise ValueError("Input JSON must be an array of objects")
-    
-    total_entries = len(data)
-    if max_entries:
-        total_entries = min(total_entries, max_entries)
-    
-    print(f"Processing {total_entries} entries...")
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        for i, thread in enumerate(data[:total_entries]):
-            if i % 1000 == 0:
-                print(f"Processed {i}/{total_entries} entries...")
-            
-            try:
-                jsonl_entry = convert_thread_to_jsonl_entry(thread)
-                f.write(json.dumps(jsonl_entry, ensure_ascii=False) + '\n')
-            except Exception as e:
-                print(f"Error processing entry {i}: {e}")
-                continue
-    
-    print(f"Conversion complete! Output saved to {output_file}")
+
+    if num_proc is None:
+        num_proc = os.cpu_count() or 1
+
+    threads = iter_input_threads(input_file, max_entries)
+    count = 0
+
+    # Accumulate ~1 MiB of serialized bytes before each write so the write
+    # stage issues large sequential writes instead of one syscall per entry.
+    buf = bytearray()
+
+    with open(output_file, 'wb', buffering=_WRITE_BUF_SIZE) as f:
+        if num_proc <= 1:
+            for i, thread in enumerate(threads):
+                if i % 1000 == 0:
+                    print(f"Processed {i} entries...")
+
+                try:
+                    jsonl_entry = convert_thread_to_jsonl_entry(thread)
+                    buf += _dumps_line(jsonl_entry)
+                    count += 1
+                except Exception as e:
+                    print(f"Error processing entry {i}: {e}")
+                    continue
+
+                if len(buf) > _WRITE_BUF_SIZE:
+                    f.write(buf)
+                    buf.clear()
+        else:
+            with multiprocessing.Pool(num_proc, initializer=_init_worker) as pool:
+                results = pool.imap_unordered(_convert_thread_safe,
+                                              threads, chunksize=256)
+                for i, jsonl_entry in enumerate(results):
+                    if i % 1000 == 0:
+                        print(f"Processed {i} entries...")
+                    if jsonl_entry is None:
+                        continue
+                    buf += _dumps_line(jsonl_entry)
+                    count += 1
+
+                    if len(buf) > _WRITE_BUF_SIZE:
+                        f.write(buf)
+                        buf.clear()
+
+        if buf:
+            f.write(buf)
+
+    print(f"Conversion complete! Wrote {count} entries to {output_file}")
 
 def main():
     parser = argparse.ArgumentParser(description='Convert cooking.json to JSONL format')
     parser.add_argument('--input', '-i', default='cooking.json', help='Input JSON file')
     parser.add_argument('--output', '-o', default='cooking.jsonl', help='Output JSONL file')
     parser.add_argument('--max-entries', '-m', type=int, help='Maximum number of entries to process (for testing)')
-    
+    parser.add_argument('--num-proc', '-p', type=int, default=os.cpu_count(),
+                        help='Number of worker processes (default: all cores)')
+
     args = parser.parse_args()
-    
+
     try:
-        convert_json_to_jsonl(args.input, args.output, args.max_entries)
+        convert_json_to_jsonl(args.input, args.output, args.max_entries, args.num_proc)
     except Exception as e:
         print(f"Error: {e}")
         return 1
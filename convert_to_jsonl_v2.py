@@ -24,22 +24,84 @@ Install (optional for language detection):
 
 import argparse
 import json
+import multiprocessing
+import os
 import re
-import uuid
 from pathlib import Path
 from typing import Iterator, Dict, Any
 
+# Prefer google-re2 (linear-time DFA) for the hot cleaning patterns; the stdlib
+# backtracking engine is the fallback. None of our patterns need backrefs.
+try:
+    import re2 as _re_engine  # type: ignore
+except ImportError:
+    _re_engine = re
+
+# orjson (Rust) is several times faster than stdlib json for the per-line
+# serialize/parse in the hot loop and emits UTF-8 bytes directly.
+try:
+    import orjson  # type: ignore
+
+    def _dumps_line(obj) -> bytes:
+        return orjson.dumps(obj) + b"\n"
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps_line(obj) -> bytes:
+        return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+    _loads = json.loads
+
 
 # -------------------- Language detection --------------------
-def detect_lang(text: str) -> str:
-    """Detect language using langid if available; else fallback to 'en'/'und'."""
+# fastText LID (lid.176.ftz) is native code and far faster than langid's
+# pure-Python classifier; used when the package and model file are present.
+_LID = None
+try:
+    import fasttext  # type: ignore
+    _lid_path = os.environ.get("FASTTEXT_LID_MODEL", "lid.176.ftz")
+    if os.path.exists(_lid_path):
+        _LID = fasttext.load_model(_lid_path)
+except ImportError:
+    pass
+
+
+# langid identifier, bound once per process by _init_worker (or lazily on
+# first call) so the model is not re-initialized per detection.
+_LANGID = None
+
+
+def _init_worker():
+    """Pool initializer: load the language-ID model once per worker."""
+    global _LANGID
+    if _LID is not None or _LANGID is not None:
+        return
     try:
         import langid  # type: ignore
-        lang, _ = langid.classify(text or "")
-        return lang or "und"
+        _LANGID = langid.langid.LanguageIdentifier.from_modelstring(
+            langid.langid.model, norm_probs=True)
     except Exception:
-        # Fallback: assume English if there are Latin letters, else undetermined
-        return "en" if text and re.search(r"[A-Za-z]", text) else "und"
+        pass
+
+
+def detect_lang(text: str) -> str:
+    """Detect language using fastText or langid if available; else fallback to 'en'/'und'."""
+    if _LID is not None:
+        try:
+            labels, _ = _LID.predict((text or "").replace("\n", " ")[:1000], k=1)
+            return labels[0][len("__label__"):] or "und"
+        except Exception:
+            pass
+    if _LANGID is None:
+        _init_worker()
+    if _LANGID is not None:
+        try:
+            lang, _ = _LANGID.classify(text or "")
+            return lang or "und"
+        except Exception:
+            pass
+    # Fallback: assume English if there are Latin letters, else undetermined
+    return "en" if text and re.search(r"[A-Za-z]", text) else "und"
 
 
 # -------------------- Cleaning helpers --------------------
@@ -59,41 +121,80 @@ RE_USER = re.compile(r"\bu/[A-Za-z0-9_-]+", re.IGNORECASE)
 RE_URL  = re.compile(r"https?://\S+")
 RE_EMAIL = re.compile(r"\b[\w\.-]+@[\w\.-]+\.\w+\b")
 RE_PHONE = re.compile(r"\b(?:\+?\d{1,3}[ -]?)?(?:\(?\d{2,4}\)?[ -]?)?\d{3,4}[ -]?\d{3,4}\b")
-
-def clean_text(text: str) -> str:
-    if not text:
-        return ""
+# One fused alternation of the above so removal happens in a single pass
+RE_JUNK = _re_engine.compile(
+    "|".join([RE_USER.pattern, RE_URL.pattern, RE_EMAIL.pattern,
+              RE_PHONE.pattern, RE_EMOJI.pattern]),
+    re.IGNORECASE,
+)
+RE_BLOCKQUOTE = _re_engine.compile(r"^[ \t]*>[ \t]*", re.MULTILINE)
+# \x1e excluded from the collapse class so the clean_fields sentinel survives
+RE_SPACES = _re_engine.compile(r"[^\S\r\n\x1e]+")
+RE_HARD_WS = _re_engine.compile(r"[ \t\r\f\v]+")
+RE_BLANKLINES = _re_engine.compile(r"\n{3,}")
+
+def _clean_buffer(text: str) -> str:
+    """All cleaning passes except the outer strip (see clean_fields)."""
     # strip markdown blockquote markers
-    text = re.sub(r"^\s*>\s*", "", text, flags=re.MULTILINE)
-    # remove usernames, urls, emails, phones, emojis
-    text = RE_USER.sub("", text)
-    text = RE_URL.sub("", text)
-    text = RE_EMAIL.sub("", text)
-    text = RE_PHONE.sub("", text)
-    text = RE_EMOJI.sub("", text)
+    text = RE_BLOCKQUOTE.sub("", text)
+    # remove usernames, urls, emails, phones, emojis in one pass
+    text = RE_JUNK.sub("", text)
     # unescape common HTML entities
     text = text.replace("&gt;", ">").replace("&lt;", "<").replace("&amp;", "&")
     # normalize whitespace
-    text = re.sub(r"[^\S\r\n]+", " ", text)      # collapse spaces but keep newlines
-    text = re.sub(r"[ \t\r\f\v]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    return text.strip()
+    text = RE_SPACES.sub(" ", text)      # collapse spaces but keep newlines
+    text = RE_HARD_WS.sub(" ", text)
+    text = RE_BLANKLINES.sub("\n\n", text)
+    return text
+
+
+def clean_text(text: str) -> str:
+    if not text:
+        return ""
+    return _clean_buffer(text).strip()
+
+
+# Field separator for clean_fields: \x1e (record separator) is in \s, so the
+# junk patterns stop at it; joined with newlines so blockquote stripping still
+# anchors at field starts.
+SEP = "\x1e"
+_SEP_JOIN = "\n\x1e\n"
+
+
+def clean_fields(*parts: str) -> list:
+    """
+    Clean several fields in one combined pass instead of one clean_text call
+    per field: join with a sentinel, run the regex passes once, split back.
+    """
+    joined = _SEP_JOIN.join(p or "" for p in parts)
+    fields = _clean_buffer(joined).split(SEP)
+    if len(fields) != len(parts):
+        # A pattern consumed a sentinel; fall back to per-field cleaning
+        return [clean_text(p) for p in parts]
+    return [f.strip() for f in fields]
 
 
 # -------------------- Thread / replies helpers --------------------
 def combine_replies(replies) -> str:
-    """Recursively collect all reply 'body' strings."""
-    chunks = []
+    """Collect all reply 'body' strings depth-first.
+
+    Iterative stack traversal with a single final join: O(n) total copying
+    (recursing and joining per subtree is O(n^2) for deep trees) and no
+    recursion-limit risk on deeply nested threads.
+    """
     if not replies:
         return ""
-    for r in replies:
+    chunks = []
+    stack = list(reversed(replies))
+    while stack:
+        r = stack.pop()
         body = r.get("body", "")
         if body:
             chunks.append(body)
         nested = r.get("replies", [])
         if isinstance(nested, list) and nested:
-            chunks.append(combine_replies(nested))
-    return "\n\n".join([c for c in chunks if c])
+            stack.extend(reversed(nested))
+    return "\n\n".join(chunks)
 
 
 def full_reddit_url(relative: str) -> str:
@@ -106,8 +207,43 @@ def full_reddit_url(relative: str) -> str:
 
 
 def extract_subreddit(url: str) -> str:
-    m = re.search(r"/r/([^/]+)/", url)
-    return m.group(1) if m else ""
+    # str.find/slice instead of regex; valid Reddit URLs never need the engine
+    i = url.find("/r/")
+    if i < 0:
+        return ""
+    j = url.find("/", i + 3)
+    return url[i + 3:j] if j > 0 else url[i + 3:]
+
+
+class UUIDGen:
+    """
+    Batched uuid4 strings: one os.urandom call per `n` ids instead of one
+    syscall plus UUID-object construction per entry (standard dashed form,
+    version/variant bits per RFC 4122).
+    """
+    def __init__(self, n: int = 4096):
+        self.n = n
+        self.buf = b""
+        self.i = n
+        self.pid = os.getpid()
+
+    def __call__(self) -> str:
+        # Refill after fork too, so pool workers never share a buffer
+        if self.i >= self.n or os.getpid() != self.pid:
+            self.buf = os.urandom(16 * self.n)
+            self.i = 0
+            self.pid = os.getpid()
+
+        off = 16 * self.i
+        self.i += 1
+        raw = bytearray(self.buf[off:off + 16])
+        raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+        raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+        h = raw.hex()
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+_uuid4 = UUIDGen()
 
 
 def normalize_thread(thread_obj: Dict[str, Any]) -> Dict[str, Any]:
@@ -120,16 +256,15 @@ def normalize_thread(thread_obj: Dict[str, Any]) -> Dict[str, Any]:
     thread_url = full_reddit_url(url)
     subreddit  = extract_subreddit(thread_url) or "Cooking"
 
-    # Clean
-    thread_title_clean = clean_text(title)
-    thread_body_clean  = clean_text(body)
-    replies_combined   = clean_text(combine_replies(comments))
+    # Clean all three fields in one combined regex pass
+    thread_title_clean, thread_body_clean, replies_combined = clean_fields(
+        title, body, combine_replies(comments))
 
     # Language (use title + body + replies for best signal)
     lang = detect_lang(f"{thread_title_clean}\n{thread_body_clean}\n{replies_combined}")
 
     return {
-        "id": str(uuid.uuid4()),
+        "id": _uuid4(),
         "language": lang,
         "source_url": thread_url,
         "thread_title": thread_title_clean,
@@ -148,14 +283,14 @@ def iter_threads_from_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
             if not line:
                 continue
             try:
-                obj = json.loads(line)
+                obj = _loads(line)
                 if isinstance(obj, dict) and "data" in obj and isinstance(obj["data"], list):
                     for t in obj["data"]:
                         if isinstance(t, dict):
                             yield t
                 elif isinstance(obj, dict):
                     yield obj
-            except json.JSONDecodeError:
+            except ValueError:
                 continue
 
 
@@ -173,6 +308,49 @@ def iter_threads_from_json_array(path: Path) -> Iterator[Dict[str, Any]]:
                 yield t
 
 
+# Optional Numba kernel for the tolerant scanner: the depth/in-string state
+# machine compiles to a native loop over a uint8 view, ~2 orders of magnitude
+# faster than interpreted scanning on big pasted files.
+try:
+    import numpy as _np  # type: ignore
+    from numba import njit as _njit  # type: ignore
+
+    @_njit(cache=True)
+    def _scan_spans(buf):  # pragma: no cover - exercised only with numba
+        spans = []
+        depth = 0
+        in_str = False
+        esc = False
+        start = -1
+        for i in range(buf.shape[0]):
+            ch = buf[i]
+            if in_str:
+                if esc:
+                    esc = False
+                elif ch == 92:      # backslash
+                    esc = True
+                elif ch == 34:      # quote
+                    in_str = False
+            else:
+                if ch == 34:
+                    in_str = True
+                elif ch == 123:     # {
+                    if depth == 0:
+                        start = i
+                    depth += 1
+                elif ch == 125:     # }
+                    if depth > 0:
+                        depth -= 1
+                        if depth == 0 and start >= 0:
+                            spans.append((start, i + 1))
+                            start = -1
+        return spans
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
 def tolerant_array_object_iter(path: Path) -> Iterator[Dict[str, Any]]:
     """
     Tolerantly scan a (possibly truncated) JSON array and yield top-level { ... } objects.
@@ -182,43 +360,61 @@ def tolerant_array_object_iter(path: Path) -> Iterator[Dict[str, Any]]:
     start = text.find('[')
     if start == -1:
         return
+    if NUMBA_AVAILABLE:
+        # Native state-machine scan over the raw bytes; spans are byte offsets
+        data = text[start:].encode("utf-8")
+        buf = _np.frombuffer(data, dtype=_np.uint8)
+        for s, e in _scan_spans(buf):
+            try:
+                yield _loads(data[s:e])
+            except Exception:
+                pass
+        return
+    # Jump between structural chars with C-level str.find instead of walking
+    # the text one interpreted character at a time; string literals are the
+    # only place we have to look back (to count backslash escapes).
     i = start + 1
     depth = 0
-    buf = []
-    in_str = False
-    esc = False
-    while i < len(text):
-        ch = text[i]
-        if in_str:
-            buf.append(ch)
-            if esc:
-                esc = False
-            elif ch == "\\":
-                esc = True
-            elif ch == '"':
-                in_str = False
-        else:
-            if ch == '"':
-                in_str = True
-                buf.append(ch)
-            elif ch == '{':
-                depth += 1
-                buf.append(ch)
-            elif ch == '}':
+    obj_start = -1
+    while True:
+        jb = text.find('{', i)
+        je = text.find('}', i)
+        jq = text.find('"', i)
+        candidates = [j for j in (jb, je, jq) if j != -1]
+        if not candidates:
+            return
+        j = min(candidates)
+        ch = text[j]
+        if ch == '"':
+            # Skip the whole string literal (closing quote must be preceded
+            # by an even number of backslashes)
+            k = j + 1
+            while True:
+                k = text.find('"', k)
+                if k == -1:
+                    return
+                b = k - 1
+                while b >= 0 and text[b] == "\\":
+                    b -= 1
+                if (k - 1 - b) % 2 == 0:
+                    break
+                k += 1
+            i = k + 1
+        elif ch == '{':
+            if depth == 0:
+                obj_start = j
+            depth += 1
+            i = j + 1
+        else:  # '}'
+            if depth > 0:
                 depth -= 1
-                buf.append(ch)
-                if depth == 0 and buf:
-                    block = "".join(buf).strip()
-                    buf.clear()
+                if depth == 0 and obj_start != -1:
                     try:
-                        obj = json.loads(block)
-                        yield obj
+                        yield _loads(text[obj_start:j + 1])
                     except Exception:
                         pass
-            else:
-                if depth > 0:
-                    buf.append(ch)
-        i += 1
+                    obj_start = -1
+            i = j + 1
 
 
 def smart_iter_threads(path: Path) -> Iterator[Dict[str, Any]]:
@@ -241,11 +437,39 @@ def smart_iter_threads(path: Path) -> Iterator[Dict[str, Any]]:
     yield from tolerant_array_object_iter(path)
 
 
+# -------------------- Downstream helpers --------------------
+def read_jsonl_cudf(path, chunk: int = 100_000_000):
+    """
+    Yield cuDF DataFrames parsed from a (possibly huge) JSONL file in ~100 MB
+    byte-range chunks, for GPU-side analytics/filtering downstream of the
+    conversion. Requires RAPIDS cuDF; raises ImportError without it — callers
+    should fall back to the line-by-line CPU readers above.
+    """
+    import cudf  # deferred: GPU-only optional dependency
+
+    x = 0
+    while True:
+        try:
+            df = cudf.read_json(path, lines=True, byte_range=(chunk * x, chunk))
+        except RuntimeError:
+            return
+        if len(df) == 0:
+            return
+        yield df
+        x += 1
+
+
 # -------------------- Main --------------------
+# Output write-buffer size: batch serialized entries into ~1 MiB writes
+WRITE_BUF_SIZE = 1 << 20
+
+
 def main():
     ap = argparse.ArgumentParser(description="Convert cooking.json to cleaned JSONL.")
     ap.add_argument("input", help="Path to cooking.json (array) or JSONL")
     ap.add_argument("output", help="Path to write JSONL, e.g., cooking_clean.jsonl")
+    ap.add_argument("--num-proc", type=int, default=os.cpu_count(),
+                    help="Number of worker processes (default: all cores)")
     args = ap.parse_args()
 
     in_path = Path(args.input)
@@ -253,12 +477,32 @@ def main():
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
     n_in = n_out = 0
-    with out_path.open("w", encoding="utf-8") as out:
-        for raw in smart_iter_threads(in_path):
-            n_in += 1
-            norm = normalize_thread(raw)
-            out.write(json.dumps(norm, ensure_ascii=False) + "\n")
-            n_out += 1
+    # Batch serialized lines into ~1 MiB writes rather than one per entry
+    buf = bytearray()
+    with out_path.open("wb", buffering=WRITE_BUF_SIZE) as out:
+        if args.num_proc and args.num_proc > 1:
+            # CPU-bound cleaning/langid is sharded across workers; the main
+            # process keeps input order and does all the writing.
+            with multiprocessing.Pool(args.num_proc, initializer=_init_worker) as pool:
+                for norm in pool.imap(normalize_thread, smart_iter_threads(in_path),
+                                      chunksize=128):
+                    n_in += 1
+                    buf += _dumps_line(norm)
+                    n_out += 1
+                    if len(buf) > WRITE_BUF_SIZE:
+                        out.write(buf)
+                        buf.clear()
+        else:
+            for raw in smart_iter_threads(in_path):
+                n_in += 1
+                norm = normalize_thread(raw)
+                buf += _dumps_line(norm)
+                n_out += 1
+                if len(buf) > WRITE_BUF_SIZE:
+                    out.write(buf)
+                    buf.clear()
+        if buf:
+            out.write(buf)
 
     print(f"Processed {n_in} thread objects; wrote {n_out} JSONL lines to {out_path}")
 
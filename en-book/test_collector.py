@@ -7,6 +7,13 @@ This script tests the collector with a small sample to verify it works correctly
 from collector import GutenbergCookbookCollector
 import logging
 
+try:
+    import asyncio
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -31,6 +38,35 @@ def test_single_page():
         logger.error(f"Error testing single page: {e}")
         return []
 
+async def test_pages(page_urls):
+    """Fetch several search pages concurrently over one shared ClientSession."""
+    collector = GutenbergCookbookCollector(output_dir="test_output")
+
+    connector = aiohttp.TCPConnector(limit=64, limit_per_host=8, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=30)
+
+    async def fetch(session, url):
+        async with session.get(url) as resp:
+            resp.raise_for_status()
+            return await resp.text()
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                     headers=dict(collector.session.headers)) as session:
+        pages = await asyncio.gather(*[fetch(session, u) for u in page_urls],
+                                     return_exceptions=True)
+
+    all_book_ids = []
+    for url, page in zip(page_urls, pages):
+        if isinstance(page, Exception):
+            logger.error(f"Error fetching {url}: {page}")
+            continue
+        book_ids = collector.parse_book_ids_from_page(page)
+        logger.info(f"Found {len(book_ids)} book IDs on {url}")
+        all_book_ids.extend(book_ids)
+
+    return all_book_ids
+
+
 def test_download_single_book():
     """Test downloading a single book."""
     collector = GutenbergCookbookCollector(output_dir="test_output")
@@ -49,9 +85,17 @@ def test_download_single_book():
 if __name__ == "__main__":
     logger.info("Testing Gutenberg cookbook collector...")
     
-    # Test 1: Parse single page
-    logger.info("Test 1: Parsing single search page...")
-    book_ids = test_single_page()
+    # Test 1: Parse search pages (concurrently when aiohttp is available)
+    if AIOHTTP_AVAILABLE:
+        logger.info("Test 1: Parsing search pages concurrently...")
+        page_urls = [
+            f"https://www.gutenberg.org/ebooks/search/?query=cookbooks&start_index={i}"
+            for i in (1, 26, 51)
+        ]
+        book_ids = asyncio.run(test_pages(page_urls))
+    else:
+        logger.info("Test 1: Parsing single search page...")
+        book_ids = test_single_page()
     
     if book_ids:
         logger.info("✓ Single page parsing test passed")
@@ -4,361 +4,492 @@ Life Tips Crawler - Production Grade Continuous Crawling System
 
 CLI interface for running the crawling pipeline in different modes.
 """
+import argparse
 import asyncio
-import click
+import atexit
+import functools
 import logging
+import logging.handlers
+import queue
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import json
+import orjson
+
+# uvloop (libuv) is ~2-4x faster than the default selector loop for the
+# aiohttp-heavy crawl workload. Not available on Windows; set NO_UVLOOP=1 to
+# fall back to the stdlib loop when debugging.
+try:
+    if not os.environ.get('NO_UVLOOP'):
+        import uvloop
+        uvloop.install()
+except ImportError:
+    pass
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from src.config import config
-from src.pipeline import CrawlingPipeline
-from src.models import DatabaseManager
+
+
+# Storage directory keys and a one-shot guard so each process only pays the
+# stat/mkdir syscalls once, no matter how many callers ask.
+_STORAGE_DIR_KEYS = ['data_dir', 'cache_dir', 'logs_dir', 'shards_dir']
+_DIRS_READY = False
+
+
+def _ensure_dirs():
+    """Create the storage directories idempotently, once per process."""
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
+    for dir_key in _STORAGE_DIR_KEYS:
+        Path(config.get(f'storage.{dir_key}', f'./{dir_key}')).mkdir(parents=True, exist_ok=True)
+    _DIRS_READY = True
+
+
+def _database_url():
+    """Resolve the database URL from config."""
+    db_config = config.get_database_config()
+    if db_config.get('type') == 'sqlite':
+        return f"sqlite:///{db_config['sqlite']['path']}"
+    return "sqlite:///./data/crawler.db"
+
+
+@functools.lru_cache(maxsize=None)
+def _db_manager(database_url):
+    """Cached DatabaseManager so repeated CLI paths share one engine/pool.
+
+    Engine creation compiles the dialect and allocates a connection pool;
+    building it once per process also avoids SQLite file-lock churn when
+    several commands touch the database in one invocation.
+    """
+    from src.models import DatabaseManager
+
+    manager = DatabaseManager(database_url)
+    atexit.register(manager.engine.dispose)
+    return manager
 
 
 def setup_logging():
-    """Setup structured logging."""
+    """Setup structured logging.
+
+    Log records are funneled through a queue and written by a background
+    listener thread, so stream/file I/O never blocks the asyncio event loop.
+    """
     log_level = config.get('monitoring.log_level', 'INFO')
     log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    
-    logging.basicConfig(
-        level=getattr(logging, log_level),
-        format=log_format,
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler(config.get('storage.logs_dir', './logs') + '/crawler.log')
-        ]
-    )
-    
-    # Create logs directory if it doesn't exist
+
+    # Create all storage directories (incl. logs) before the FileHandler
+    # opens its file
+    _ensure_dirs()
     logs_dir = Path(config.get('storage.logs_dir', './logs'))
-    logs_dir.mkdir(parents=True, exist_ok=True)
 
+    formatter = logging.Formatter(log_format)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    file_handler = logging.FileHandler(str(logs_dir / 'crawler.log'))
+    file_handler.setFormatter(formatter)
 
-@click.group()
-@click.option('--config-file', default='config.yaml', help='Configuration file path')
-@click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
-def cli(config_file, verbose):
-    """Life Tips Crawler - Production grade continuous crawling system."""
-    # Setup logging
-    setup_logging()
-    
-    if verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
-    
-    # Create necessary directories
-    for dir_key in ['data_dir', 'cache_dir', 'logs_dir', 'shards_dir']:
-        dir_path = Path(config.get(f'storage.{dir_key}', f'./{dir_key}'))
-        dir_path.mkdir(parents=True, exist_ok=True)
-    
-    click.echo(f"Life Tips Crawler initialized with config: {config_file}")
-
-
-@cli.command()
-@click.option('--domains', help='File containing allowed domains (one per line)')
-@click.option('--concurrency', type=int, help='Number of concurrent workers')
-@click.option('--max-pages', type=int, help='Maximum pages to crawl')
-@click.option('--max-time', type=int, help='Maximum time to run (hours)')
-@click.option('--continuous', is_flag=True, help='Run in continuous mode')
-def crawl(domains, concurrency, max_pages, max_time, continuous):
+    log_queue = queue.SimpleQueue()
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(getattr(logging, log_level))
+    root_logger.handlers.clear()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+
+def _cmd_crawl(args):
     """Crawl websites and extract daily life content."""
-    click.echo("Starting crawl mode...")
-    
+    print("Starting crawl mode...")
+
     async def run_crawl():
-        pipeline = CrawlingPipeline()
-        
+        from src.pipeline import CrawlingPipeline, RunOptions
+
+        # Load domains if provided. One read() + a single C-level splitlines
+        # beats the per-line text-mode iteration on large seed files.
+        seeds = None
+        if args.domains:
+            domains_file = Path(args.domains)
+            if domains_file.exists():
+                raw = domains_file.read_bytes()
+                seeds = tuple(s for s in map(str.strip, raw.decode().splitlines()) if s)
+                print(f"Loaded {len(seeds)} domains from {args.domains}")
+
+        opts = RunOptions(
+            concurrency=args.concurrency,
+            max_pages=args.max_pages,
+            max_time_hours=args.max_time,
+            seeds=seeds,
+        )
+        pipeline = CrawlingPipeline(options=opts)
+
         try:
-            # Override configuration if provided
-            if concurrency:
-                config.config['crawler']['concurrency'] = concurrency
-            
-            # Load domains if provided
-            if domains:
-                domains_file = Path(domains)
-                if domains_file.exists():
-                    with open(domains_file, 'r') as f:
-                        domain_list = [line.strip() for line in f if line.strip()]
-                    config.config['domains']['seeds'] = domain_list
-                    click.echo(f"Loaded {len(domain_list)} domains from {domains}")
-            
-            if continuous:
-                click.echo("Running in continuous mode (Ctrl+C to stop gracefully)")
-                await pipeline.run_continuous()
-            else:
-                click.echo(f"Running crawl mode (max_pages={max_pages}, max_time={max_time})")
-                await pipeline.run_crawl_mode(max_pages=max_pages, max_time_hours=max_time)
-            
-            # Print final stats
+            # TaskGroup guarantees the crawl task is awaited or cancelled
+            # before we leave the block, so stop() in the finally never races
+            # a still-running task
+            async with asyncio.TaskGroup() as tg:
+                if args.continuous:
+                    print("Running in continuous mode (Ctrl+C to stop gracefully)")
+                    tg.create_task(pipeline.run_continuous())
+                else:
+                    print(f"Running crawl mode (max_pages={args.max_pages}, max_time={args.max_time})")
+                    tg.create_task(pipeline.run_crawl_mode(
+                        max_pages=opts.max_pages, max_time_hours=opts.max_time_hours
+                    ))
+
+            # Print final stats in one write so lines don't interleave with
+            # the queued log output
             stats = pipeline.get_pipeline_stats()
-            click.echo("\n=== Crawl Complete ===")
-            click.echo(f"Pages crawled: {stats.get('pages_crawled', 0)}")
-            click.echo(f"Success rate: {stats.get('success_rate', 0):.2%}")
-            click.echo(f"Entries exported: {stats.get('entries_exported', 0)}")
-            click.echo(f"Runtime: {stats.get('runtime_hours', 0):.2f} hours")
-            
+            print('\n'.join([
+                "\n=== Crawl Complete ===",
+                f"Pages crawled: {stats.get('pages_crawled', 0)}",
+                f"Success rate: {stats.get('success_rate', 0):.2%}",
+                f"Entries exported: {stats.get('entries_exported', 0)}",
+                f"Runtime: {stats.get('runtime_hours', 0):.2f} hours",
+            ]))
+
         except KeyboardInterrupt:
-            click.echo("\nGraceful shutdown requested...")
+            print("\nGraceful shutdown requested...")
         except Exception as e:
-            click.echo(f"Error during crawling: {e}")
+            print(f"Error during crawling: {e}")
             sys.exit(1)
         finally:
             await pipeline.stop()
-    
+
     asyncio.run(run_crawl())
 
 
-@cli.command()
-@click.option('--input', required=True, help='Input directory containing raw data')
-@click.option('--output', required=True, help='Output directory for cleaned data')
-@click.option('--batch-size', type=int, default=100, help='Batch size for processing')
-def clean(input, output, batch_size):
+def _cmd_clean(args):
     """Clean and normalize existing content data."""
-    click.echo(f"Starting clean mode: {input} -> {output}")
-    
+    print(f"Starting clean mode: {args.input} -> {args.output}")
+
     async def run_clean():
+        from src.pipeline import CrawlingPipeline
         pipeline = CrawlingPipeline()
-        
+
         try:
-            result_count = await pipeline.run_clean_mode(input, output)
-            click.echo(f"Cleaned {result_count} entries")
-            
+            async with asyncio.TaskGroup() as tg:
+                clean_task = tg.create_task(pipeline.run_clean_mode(args.input, args.output))
+
+            print(f"Cleaned {clean_task.result()} entries")
+
         except Exception as e:
-            click.echo(f"Error during cleaning: {e}")
+            print(f"Error during cleaning: {e}")
             sys.exit(1)
         finally:
             await pipeline.stop()
-    
+
     asyncio.run(run_clean())
 
 
-@cli.command()
-@click.option('--input', help='Input directory containing processed data')
-@click.option('--shard-size', type=int, help='Number of entries per shard')
-@click.option('--out-dir', required=True, help='Output directory for JSONL shards')
-@click.option('--validate', is_flag=True, help='Validate exported shards')
-def export(input, shard_size, out_dir, validate):
+def _cmd_export(args):
     """Export processed content to JSONL shards."""
-    click.echo(f"Starting export mode to: {out_dir}")
-    
+    print(f"Starting export mode to: {args.out_dir}")
+
     async def run_export():
-        pipeline = CrawlingPipeline()
-        
+        from src.pipeline import CrawlingPipeline, RunOptions
+
+        opts = RunOptions(shard_size=args.shard_size, shards_dir=args.out_dir)
+        pipeline = CrawlingPipeline(options=opts)
+
         try:
-            # Override shard size if provided
-            if shard_size:
-                config.config['export']['shard_size'] = shard_size
-            
-            # Override output directory
-            config.config['storage']['shards_dir'] = out_dir
-            
-            exported_count = await pipeline.run_export_mode()
-            click.echo(f"Exported {exported_count} entries")
-            
+            async with asyncio.TaskGroup() as tg:
+                export_task = tg.create_task(pipeline.run_export_mode())
+
+            print(f"Exported {export_task.result()} entries")
+
             # Validate shards if requested
-            if validate:
-                click.echo("Validating exported shards...")
-                shard_dir = Path(out_dir)
-                for shard_file in shard_dir.glob('*.jsonl'):
-                    validation_result = await pipeline.jsonl_exporter.validate_shard(str(shard_file))
+            if args.validate:
+                print("Validating exported shards...")
+                shard_dir = Path(args.out_dir)
+
+                # Validate up to 8 shards concurrently; each validation is
+                # I/O-bound (read back + parse), so overlapping them helps
+                semaphore = asyncio.Semaphore(8)
+
+                async def validate_one(path):
+                    async with semaphore:
+                        return path, await pipeline.jsonl_exporter.validate_shard(str(path))
+
+                results = await asyncio.gather(
+                    *[validate_one(p) for p in shard_dir.glob('*.jsonl')]
+                )
+                for shard_file, validation_result in results:
                     if validation_result['valid']:
-                        click.echo(f"✓ {shard_file.name}: {validation_result['entry_count']} entries")
+                        print(f"✓ {shard_file.name}: {validation_result['entry_count']} entries")
                     else:
-                        click.echo(f"✗ {shard_file.name}: {len(validation_result['errors'])} errors")
-            
+                        print(f"✗ {shard_file.name}: {len(validation_result['errors'])} errors")
+
         except Exception as e:
-            click.echo(f"Error during export: {e}")
+            print(f"Error during export: {e}")
             sys.exit(1)
         finally:
             await pipeline.stop()
-    
+
     asyncio.run(run_export())
 
 
-@cli.command()
-@click.option('--out-dir', required=True, help='Output directory for final data')
-@click.option('--concurrency', type=int, help='Number of concurrent workers')
-@click.option('--max-pages', type=int, help='Maximum pages to crawl')
-@click.option('--max-time', type=int, help='Maximum time to run (hours)')
-@click.option('--continuous', is_flag=True, help='Run in continuous mode')
-def all(out_dir, concurrency, max_pages, max_time, continuous):
+def _cmd_all(args):
     """Run complete pipeline: crawl, clean, and export."""
-    click.echo("Starting complete pipeline...")
-    
+    print("Starting complete pipeline...")
+
     async def run_all():
-        pipeline = CrawlingPipeline()
-        
+        from src.pipeline import CrawlingPipeline, RunOptions
+
+        opts = RunOptions(
+            concurrency=args.concurrency,
+            shards_dir=args.out_dir,
+            max_pages=args.max_pages,
+            max_time_hours=args.max_time,
+        )
+        pipeline = CrawlingPipeline(options=opts)
+
         try:
-            # Override configuration if provided
-            if concurrency:
-                config.config['crawler']['concurrency'] = concurrency
-            
-            config.config['storage']['shards_dir'] = out_dir
-            
-            if continuous:
-                click.echo("Running complete pipeline in continuous mode")
-                await pipeline.run_continuous()
-            else:
-                click.echo(f"Running complete pipeline (max_pages={max_pages}, max_time={max_time})")
-                await pipeline.run_crawl_mode(max_pages=max_pages, max_time_hours=max_time)
-            
-            # Print comprehensive stats
+            async with asyncio.TaskGroup() as tg:
+                if args.continuous:
+                    print("Running complete pipeline in continuous mode")
+                    tg.create_task(pipeline.run_continuous())
+                else:
+                    print(f"Running complete pipeline (max_pages={args.max_pages}, max_time={args.max_time})")
+                    tg.create_task(pipeline.run_crawl_mode(
+                        max_pages=opts.max_pages, max_time_hours=opts.max_time_hours
+                    ))
+
+            # Print comprehensive stats in one write so lines don't
+            # interleave with the queued log output
             stats = pipeline.get_pipeline_stats()
-            click.echo("\n=== Pipeline Complete ===")
-            click.echo(f"Pages crawled: {stats.get('pages_crawled', 0)}")
-            click.echo(f"Success rate: {stats.get('success_rate', 0):.2%}")
-            click.echo(f"Acceptance rate: {stats.get('acceptance_rate', 0):.2%}")
-            click.echo(f"Duplicate rate: {stats.get('duplicate_rate', 0):.2%}")
-            click.echo(f"Entries exported: {stats.get('entries_exported', 0)}")
-            click.echo(f"Entries per day: {stats.get('entries_per_day', 0):.1f}")
-            click.echo(f"Runtime: {stats.get('runtime_hours', 0):.2f} hours")
-            
+            lines = [
+                "\n=== Pipeline Complete ===",
+                f"Pages crawled: {stats.get('pages_crawled', 0)}",
+                f"Success rate: {stats.get('success_rate', 0):.2%}",
+                f"Acceptance rate: {stats.get('acceptance_rate', 0):.2%}",
+                f"Duplicate rate: {stats.get('duplicate_rate', 0):.2%}",
+                f"Entries exported: {stats.get('entries_exported', 0)}",
+                f"Entries per day: {stats.get('entries_per_day', 0):.1f}",
+                f"Runtime: {stats.get('runtime_hours', 0):.2f} hours",
+            ]
+
             # Performance check
             target_entries_per_day = config.get('performance.target_entries_per_day', 1500)
             actual_entries_per_day = stats.get('entries_per_day', 0)
-            
+
             if actual_entries_per_day >= target_entries_per_day:
-                click.echo(f"✓ Performance target met: {actual_entries_per_day:.1f} >= {target_entries_per_day}")
+                lines.append(f"✓ Performance target met: {actual_entries_per_day:.1f} >= {target_entries_per_day}")
             else:
-                click.echo(f"⚠ Performance target not met: {actual_entries_per_day:.1f} < {target_entries_per_day}")
-            
+                lines.append(f"⚠ Performance target not met: {actual_entries_per_day:.1f} < {target_entries_per_day}")
+
+            print('\n'.join(lines))
+
         except KeyboardInterrupt:
-            click.echo("\nGraceful shutdown requested...")
+            print("\nGraceful shutdown requested...")
         except Exception as e:
-            click.echo(f"Error during pipeline execution: {e}")
+            print(f"Error during pipeline execution: {e}")
             sys.exit(1)
         finally:
             await pipeline.stop()
-    
+
     asyncio.run(run_all())
 
 
-@cli.command()
-@click.option('--format', type=click.Choice(['json', 'table']), default='table', help='Output format')
-def status(format):
+def _cmd_status(args):
     """Show pipeline status and statistics."""
-    click.echo("Checking pipeline status...")
-    
+    print("Checking pipeline status...")
+
     try:
-        # Initialize database to check status
-        db_config = config.get_database_config()
-        if db_config.get('type') == 'sqlite':
-            database_url = f"sqlite:///{db_config['sqlite']['path']}"
-        else:
-            database_url = "sqlite:///./data/crawler.db"
-        
-        db_manager = DatabaseManager(database_url)
-        
+        # Initialize database to check status (deferred import: pulls sqlalchemy)
+        db_manager = _db_manager(_database_url())
+
         # Get last checkpoint
         checkpoint = db_manager.get_system_state('pipeline_checkpoint')
-        
+
         if checkpoint:
-            if format == 'json':
-                click.echo(json.dumps(checkpoint, indent=2))
+            if args.format == 'json':
+                print(orjson.dumps(checkpoint, option=orjson.OPT_INDENT_2).decode())
             else:
-                click.echo("\n=== Pipeline Status ===")
                 stats = checkpoint.get('stats', {})
-                click.echo(f"Last update: {checkpoint.get('timestamp', 'Unknown')}")
-                click.echo(f"Pages crawled: {stats.get('pages_crawled', 0)}")
-                click.echo(f"Success rate: {stats.get('success_rate', 0):.2%}")
-                click.echo(f"Acceptance rate: {stats.get('acceptance_rate', 0):.2%}")
-                click.echo(f"Entries exported: {stats.get('entries_exported', 0)}")
+                print('\n'.join([
+                    "\n=== Pipeline Status ===",
+                    f"Last update: {checkpoint.get('timestamp', 'Unknown')}",
+                    f"Pages crawled: {stats.get('pages_crawled', 0)}",
+                    f"Success rate: {stats.get('success_rate', 0):.2%}",
+                    f"Acceptance rate: {stats.get('acceptance_rate', 0):.2%}",
+                    f"Entries exported: {stats.get('entries_exported', 0)}",
+                ]))
         else:
-            click.echo("No pipeline status found. Run the pipeline first.")
-    
+            print("No pipeline status found. Run the pipeline first.")
+
     except Exception as e:
-        click.echo(f"Error checking status: {e}")
+        print(f"Error checking status: {e}")
         sys.exit(1)
 
 
-@cli.command()
-def validate():
+def _cmd_validate(args):
     """Validate configuration and system requirements."""
-    click.echo("Validating system configuration...")
-    
-    issues = []
-    
-    # Check required directories
-    required_dirs = ['data_dir', 'cache_dir', 'logs_dir', 'shards_dir']
-    for dir_key in required_dirs:
+    print("Validating system configuration...")
+
+    # Each check returns (messages, issue-or-None) and touches independent
+    # resources, so they run on threads: the blocking mkdir/DB syscalls
+    # overlap instead of executing back to back.
+    def _check_dir(dir_key):
         dir_path = Path(config.get(f'storage.{dir_key}', f'./{dir_key}'))
-        if not dir_path.exists():
-            try:
-                dir_path.mkdir(parents=True, exist_ok=True)
-                click.echo(f"✓ Created directory: {dir_path}")
-            except Exception as e:
-                issues.append(f"Cannot create directory {dir_path}: {e}")
-        else:
-            click.echo(f"✓ Directory exists: {dir_path}")
-    
-    # Check database connection
-    try:
-        db_config = config.get_database_config()
-        if db_config.get('type') == 'sqlite':
-            database_url = f"sqlite:///{db_config['sqlite']['path']}"
-        else:
-            database_url = "sqlite:///./data/crawler.db"
-        
-        db_manager = DatabaseManager(database_url)
-        db_manager.create_tables()
-        click.echo("✓ Database connection successful")
-    except Exception as e:
-        issues.append(f"Database connection failed: {e}")
-    
-    # Check seed URLs
-    seeds = config.get_domain_seeds()
-    if seeds:
-        click.echo(f"✓ Found {len(seeds)} seed URLs")
-    else:
-        issues.append("No seed URLs configured")
-    
-    # Check topic configuration
-    topics = config.get_allowed_topics()
-    if topics:
-        click.echo(f"✓ Found {len(topics)} allowed topics")
-    else:
-        issues.append("No allowed topics configured")
-    
-    # Performance settings
-    concurrency = config.get('crawler.concurrency', 64)
-    target_entries = config.get('performance.target_entries_per_day', 1500)
-    click.echo(f"✓ Concurrency: {concurrency}")
-    click.echo(f"✓ Target entries per day: {target_entries}")
-    
+        try:
+            dir_path.mkdir(parents=True, exist_ok=True)
+            return [f"✓ Directory exists: {dir_path}"], None
+        except Exception as e:
+            return [], f"Cannot create storage directory {dir_path}: {e}"
+
+    def _check_db():
+        # Deferred import: pulls sqlalchemy
+        try:
+            db_manager = _db_manager(_database_url())
+            db_manager.create_tables()
+            return ["✓ Database connection successful"], None
+        except Exception as e:
+            return [], f"Database connection failed: {e}"
+
+    def _check_seeds():
+        seeds = config.get_domain_seeds()
+        if seeds:
+            return [f"✓ Found {len(seeds)} seed URLs"], None
+        return [], "No seed URLs configured"
+
+    def _check_topics():
+        topics = config.get_allowed_topics()
+        if topics:
+            return [f"✓ Found {len(topics)} allowed topics"], None
+        return [], "No allowed topics configured"
+
+    def _check_performance():
+        concurrency = config.get('crawler.concurrency', 64)
+        target_entries = config.get('performance.target_entries_per_day', 1500)
+        return [f"✓ Concurrency: {concurrency}",
+                f"✓ Target entries per day: {target_entries}"], None
+
+    checks = [functools.partial(_check_dir, dir_key) for dir_key in _STORAGE_DIR_KEYS]
+    checks += [_check_db, _check_seeds, _check_topics, _check_performance]
+
+    issues = []
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(check) for check in checks]
+        for future in futures:
+            messages, issue = future.result()
+            for message in messages:
+                print(message)
+            if issue:
+                issues.append(issue)
+
     # Report issues
     if issues:
-        click.echo(f"\n⚠ Found {len(issues)} issues:")
+        print(f"\n⚠ Found {len(issues)} issues:")
         for issue in issues:
-            click.echo(f"  - {issue}")
+            print(f"  - {issue}")
         sys.exit(1)
     else:
-        click.echo("\n✓ All validations passed!")
+        print("\n✓ All validations passed!")
 
 
-@cli.command()
-@click.option('--days', type=int, default=30, help='Days of data to keep')
-def cleanup(days):
+def _cmd_cleanup(args):
     """Clean up old data and optimize database."""
-    click.echo(f"Cleaning up data older than {days} days...")
-    
+    print(f"Cleaning up data older than {args.days} days...")
+
     async def run_cleanup():
-        pipeline = CrawlingPipeline()
-        
+        # Plain SQL deletes against the shared engine; no need to build a
+        # full CrawlingPipeline (fetchers, classifier, dedup) for this
+        from src.cleanup import cleanup_old_data
+
         try:
-            await pipeline._cleanup_old_data()
-            click.echo("Cleanup completed successfully")
-            
+            db_manager = _db_manager(_database_url())
+            db_manager.create_tables()
+            deleted = await cleanup_old_data(db_manager, days=args.days)
+            print(f"Cleanup completed successfully ({deleted} rows removed)")
+
         except Exception as e:
-            click.echo(f"Error during cleanup: {e}")
+            print(f"Error during cleanup: {e}")
             sys.exit(1)
-        finally:
-            await pipeline.stop()
-    
+
     asyncio.run(run_cleanup())
 
 
+def _build_parser():
+    """Build the argument parser with one subparser per command.
+
+    argparse (stdlib) keeps the import graph minimal so frequent
+    cron-driven invocations of status/validate start fast.
+    """
+    parser = argparse.ArgumentParser(
+        description='Life Tips Crawler - Production grade continuous crawling system.'
+    )
+    parser.add_argument('--config-file', default='config.yaml', help='Configuration file path')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose logging')
+
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    p = subparsers.add_parser('crawl', help='Crawl websites and extract daily life content')
+    p.add_argument('--domains', help='File containing allowed domains (one per line)')
+    p.add_argument('--concurrency', type=int, help='Number of concurrent workers')
+    p.add_argument('--max-pages', type=int, help='Maximum pages to crawl')
+    p.add_argument('--max-time', type=int, help='Maximum time to run (hours)')
+    p.add_argument('--continuous', action='store_true', help='Run in continuous mode')
+    p.set_defaults(func=_cmd_crawl)
+
+    p = subparsers.add_parser('clean', help='Clean and normalize existing content data')
+    p.add_argument('--input', required=True, help='Input directory containing raw data')
+    p.add_argument('--output', required=True, help='Output directory for cleaned data')
+    p.add_argument('--batch-size', type=int, default=100, help='Batch size for processing')
+    p.set_defaults(func=_cmd_clean)
+
+    p = subparsers.add_parser('export', help='Export processed content to JSONL shards')
+    p.add_argument('--input', help='Input directory containing processed data')
+    p.add_argument('--shard-size', type=int, help='Number of entries per shard')
+    p.add_argument('--out-dir', required=True, help='Output directory for JSONL shards')
+    p.add_argument('--validate', action='store_true', help='Validate exported shards')
+    p.set_defaults(func=_cmd_export)
+
+    p = subparsers.add_parser('all', help='Run complete pipeline: crawl, clean, and export')
+    p.add_argument('--out-dir', required=True, help='Output directory for final data')
+    p.add_argument('--concurrency', type=int, help='Number of concurrent workers')
+    p.add_argument('--max-pages', type=int, help='Maximum pages to crawl')
+    p.add_argument('--max-time', type=int, help='Maximum time to run (hours)')
+    p.add_argument('--continuous', action='store_true', help='Run in continuous mode')
+    p.set_defaults(func=_cmd_all)
+
+    p = subparsers.add_parser('status', help='Show pipeline status and statistics')
+    p.add_argument('--format', choices=['json', 'table'], default='table', help='Output format')
+    p.set_defaults(func=_cmd_status)
+
+    p = subparsers.add_parser('validate', help='Validate configuration and system requirements')
+    p.set_defaults(func=_cmd_validate)
+
+    p = subparsers.add_parser('cleanup', help='Clean up old data and optimize database')
+    p.add_argument('--days', type=int, default=30, help='Days of data to keep')
+    p.set_defaults(func=_cmd_cleanup)
+
+    return parser
+
+
+def main(argv=None):
+    """Life Tips Crawler - Production grade continuous crawling system."""
+    args = _build_parser().parse_args(argv)
+
+    # Setup logging (creates the storage directories first)
+    _ensure_dirs()
+    setup_logging()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    print(f"Life Tips Crawler initialized with config: {args.config_file}")
+
+    args.func(args)
+
+
 if __name__ == '__main__':
-    cli() 
\ No newline at end of file
+    main()
@@ -0,0 +1,43 @@
+"""
+Numba-compiled kernels for the deduplication hot loops.
+
+Importing this module requires numba; callers guard the import and fall
+back to their vectorized numpy paths when it is absent. cache=True
+persists the compiled machine code on disk, so only the first process
+ever pays the compile cost.
+"""
+import numpy as np
+from numba import njit, prange
+
+# SWAR popcount constants, kept as uint64 so the kernel arithmetic never
+# promotes through int64/float64
+_M1 = np.uint64(0x5555555555555555)
+_M2 = np.uint64(0x3333333333333333)
+_M4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+_H01 = np.uint64(0x0101010101010101)
+_S1 = np.uint64(1)
+_S2 = np.uint64(2)
+_S4 = np.uint64(4)
+_S56 = np.uint64(56)
+
+
+@njit(inline='always')
+def _popcount64(x):
+    """Bit count of a 64-bit word (SWAR, branch-free)."""
+    x = x - ((x >> _S1) & _M1)
+    x = (x & _M2) + ((x >> _S2) & _M2)
+    x = (x + (x >> _S4)) & _M4
+    return (x * _H01) >> _S56
+
+
+@njit(parallel=True, cache=True)
+def hamming_scan(query, cands, out):
+    """Hamming distance from query to every candidate hash.
+
+    Args:
+        query: np.uint64 query simhash
+        cands: np.uint64 array of candidate simhashes
+        out: np.uint8 output array, same length as cands
+    """
+    for i in prange(cands.shape[0]):
+        out[i] = _popcount64(cands[i] ^ query)
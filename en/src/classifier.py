@@ -2,255 +2,475 @@
 Topic classification system with rule-based filtering and ML assistance.
 """
 import re
+import asyncio
 import logging
-from typing import Dict, List, Optional, Tuple, Any, Set
+from typing import Dict, List, Optional, Tuple, Any, Sequence, Set
 from dataclasses import dataclass
-from collections import Counter
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import math
+import os
+import sys
+import types
+
+import ahocorasick
+import numpy as np
+
+# Prefer google-re2 (linear-time DFA engine) for the classifier patterns;
+# the topic/exclusion alternations use no backreferences or lookarounds, so
+# re2 is a drop-in. Falls back to the stdlib backtracking engine.
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+# Hyperscan compiles every topic pattern into one SIMD-scanned block
+# database, so a single pass of the text replaces the per-topic findall
+# loop. Optional: the classifier falls back to per-topic regex scans.
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
 
 from .config import config
 
 logger = logging.getLogger(__name__)
 
+# Optional Numba kernel for the score aggregation: counts from the shared
+# automaton/Hyperscan passes are weighted, summed and normalized in one
+# native loop instead of per-topic Python arithmetic. Falls back to the
+# equivalent vectorized NumPy expression.
+try:
+    from numba import njit as _njit
+
+    @_njit(cache=True)
+    def _aggregate_scores(pattern_counts, keyword_counts, inv_norm, out):
+        # Pattern hits weigh 2.0, keyword hits 1.0; normalized by the
+        # shared reciprocal log-length factor
+        for i in range(out.shape[0]):
+            out[i] = (pattern_counts[i] * 2.0 + keyword_counts[i]) * inv_norm
+except ImportError:
+    def _aggregate_scores(pattern_counts, keyword_counts, inv_norm, out):
+        # Pattern hits weigh 2.0, keyword hits 1.0; normalized by the
+        # shared reciprocal log-length factor
+        np.multiply(pattern_counts, 2.0, out=out)
+        out += keyword_counts
+        out *= inv_norm
+
+# Compiled once at import and fused into single alternations: validation
+# used to rebuild six exclusion patterns and three promo patterns per call
+# and run each against the text separately. Every caller lowercases the
+# text first, so the patterns compile without IGNORECASE and skip the
+# per-character case folding in the engine.
+_EXCLUSION_RE = _re_engine.compile(
+    r'\b(?:news|politics|election|government|war|violence'
+    r'|celebrity|gossip|entertainment|movie|tv\s+show'
+    r'|sports|game|match|tournament|league'
+    r'|investment|stock|crypto|finance|money|business'
+    r'|medical|diagnosis|treatment|prescription|drug'
+    r'|legal|law|court|lawsuit|attorney)\b'
+)
+
+_PROMO_RE = _re_engine.compile(
+    r'\b(?:buy|purchase|order|sale|discount|offer|deal'
+    r'|click|visit|website|link|url|www'
+    r'|affiliate|sponsored|advertisement|promo)\b'
+)
+
+def _fast_word_count(s: str) -> int:
+    """Approximate word count without materializing the token list.
+
+    str.split() allocates one str object per word just to take the length;
+    counting separator characters is a few C-level scans instead. Runs of
+    whitespace over-count slightly, which is fine for the log normalizer
+    and the promo-ratio threshold this feeds.
+    """
+    if not s:
+        return 0
+    return s.count(' ') + s.count('\n') + s.count('\t') + 1
+
+
+# Topic -> subdomain mapping, built once at import (it used to be
+# reconstructed as a 22-entry dict literal on every _get_subdomain call).
+# The read-only proxy makes accidental mutation impossible.
+_SUBDOMAIN_MAPPING = types.MappingProxyType({
+    'daily_life_tips': 'general_tips',
+    'cooking_techniques': 'culinary_skills',
+    'home_care': 'household_maintenance',
+    'object_usage_and_actions': 'tool_usage',
+    'personal_care': 'self_maintenance',
+    'healthy_alternatives': 'health_choices',
+    'cleaning_techniques': 'sanitation_methods',
+    'object_placement': 'organization_systems',
+    'food_handling': 'food_safety',
+    'crafting_and_diy': 'creative_projects',
+    'odor_removal': 'scent_management',
+    'food_preservation': 'food_storage',
+    'object_modification': 'item_customization',
+    'object_storage': 'storage_solutions',
+    'object_shapes_and_functions': 'design_analysis',
+    'food_allergy_substitutions': 'dietary_alternatives',
+    'personal_hygiene': 'cleanliness_practices',
+    'carrying_objects': 'transport_methods',
+    'food_preparation': 'cooking_prep',
+    'healthy_drinks': 'beverage_wellness',
+    'food_seasoning': 'flavor_enhancement',
+    'reasoning_about_object_functions': 'functional_analysis',
+})
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ClassificationResult:
     """Result of topic classification."""
     topic: Optional[str]
     confidence: float
     subdomain: Optional[str]
-    matched_keywords: List[str]
+    matched_keywords: Sequence[str]
     rule_score: float
     ml_score: Optional[float]
     is_allowed: bool
     rejection_reason: Optional[str]
 
 
+# Shared sentinels for the common rejection paths: every field is a fixed
+# sentinel value, so one instance per reason avoids an allocation per
+# rejected document. frozen plus the empty tuple keeps the shared
+# instances immutable end to end; a mutable [] here would let one caller
+# taint every later rejection.
+_EMPTY_RESULT = ClassificationResult(
+    topic=None, confidence=0.0, subdomain=None, matched_keywords=(),
+    rule_score=0.0, ml_score=None, is_allowed=False,
+    rejection_reason="empty_content"
+)
+
+_NO_MATCH_RESULT = ClassificationResult(
+    topic=None, confidence=0.0, subdomain=None, matched_keywords=(),
+    rule_score=0.0, ml_score=None, is_allowed=False,
+    rejection_reason="no_matching_topics"
+)
+
+_EXCLUDED_RESULT = ClassificationResult(
+    topic=None, confidence=0.0, subdomain=None, matched_keywords=(),
+    rule_score=0.0, ml_score=None, is_allowed=False,
+    rejection_reason="excluded_topic"
+)
+
+_LOW_QUALITY_RESULT = ClassificationResult(
+    topic=None, confidence=0.0, subdomain=None, matched_keywords=(),
+    rule_score=0.0, ml_score=None, is_allowed=False,
+    rejection_reason="low_quality"
+)
+
+
 class RuleBasedClassifier:
     """Rule-based topic classifier using keyword matching and patterns."""
-    
+
+    # Per-topic pattern alternatives. Each topic's alternatives are fused
+    # into a single alternation at compile time, so scoring scans the text
+    # once per topic instead of once per alternative group.
+    _TOPIC_TERMS = {
+        'daily_life_tips': (
+            r'tip|hack|advice|guide|how\s+to|life\s+hack|helpful|useful'
+            r'|easy|simple|quick|efficient|better|improve'
+            r'|everyday|daily|routine|habit|lifestyle'
+        ),
+        'cooking_techniques': (
+            r'cook|recipe|bake|fry|boil|steam|grill|roast|sauté|simmer'
+            r'|technique|method|preparation|ingredient|seasoning'
+            r'|kitchen|culinary|chef|cooking|food'
+        ),
+        'home_care': (
+            r'clean|maintain|repair|organize|home|house|household'
+            r'|maintenance|upkeep|care|preservation|storage'
+            r'|furniture|appliance|room|space|interior'
+        ),
+        'object_usage_and_actions': (
+            r'use|operate|handle|manipulate|tool|device|gadget'
+            r'|function|purpose|application|utility|operation'
+            r'|instructions|manual|guide|directions'
+        ),
+        'personal_care': (
+            r'hygiene|grooming|health|wellness|self-care|skincare'
+            r'|beauty|cosmetic|personal|body|face|hair'
+            r'|routine|regimen|treatment|care|maintenance'
+        ),
+        'healthy_alternatives': (
+            r'healthy|alternative|substitute|natural|organic|wholesome'
+            r'|nutrition|nutritious|diet|wellness|health'
+            r'|replace|swap|instead|better|healthier'
+        ),
+        'cleaning_techniques': (
+            r'clean|wash|scrub|sanitize|disinfect|polish|wipe'
+            r'|cleaning|cleaner|detergent|soap|solution'
+            r'|stain|dirt|grime|mess|spot|residue'
+        ),
+        'object_placement': (
+            r'organize|arrange|place|position|store|storage'
+            r'|organization|arrangement|placement|layout|setup'
+            r'|shelf|cabinet|drawer|container|space'
+        ),
+        'food_handling': (
+            r'food\s+safety|handling|storage|preparation|preservation'
+            r'|fresh|spoilage|expiration|contamination|hygiene'
+            r'|refrigerate|freeze|store|keep|maintain'
+        ),
+        'crafting_and_diy': (
+            r'craft|diy|make|create|build|handmade|homemade'
+            r'|project|tutorial|instructions|materials|supplies'
+            r'|creative|artistic|design|decoration|decor'
+        ),
+        'odor_removal': (
+            r'odor|smell|deodorize|freshen|eliminate|neutralize'
+            r'|fragrance|scent|aroma|air\s+freshener|perfume'
+        ),
+        'food_preservation': (
+            r'preserve|store|freeze|can|pickle|dry|cure'
+            r'|preservation|storage|shelf\s+life|expiration'
+        ),
+        'object_modification': (
+            r'modify|alter|customize|adapt|change|transform'
+            r'|modification|alteration|customization|upgrade'
+        ),
+        'object_storage': (
+            r'store|storage|organize|container|shelf|cabinet'
+            r'|organization|arrangement|space|room|closet'
+        ),
+        'object_shapes_and_functions': (
+            r'shape|function|purpose|design|form|structure'
+            r'|geometry|dimension|size|appearance|feature'
+        ),
+        'food_allergy_substitutions': (
+            r'allergy|substitute|alternative|replace|intolerance'
+            r'|gluten-free|dairy-free|nut-free|vegan|substitution'
+        ),
+        'personal_hygiene': (
+            r'hygiene|wash|brush|shower|clean|bathe'
+            r'|dental|oral|body|personal|cleanliness'
+        ),
+        'carrying_objects': (
+            r'carry|transport|move|lift|handle|grip'
+            r'|bag|container|holder|carrier|support'
+        ),
+        'food_preparation': (
+            r'prep|prepare|chop|slice|mix|blend|combine'
+            r'|preparation|cooking|kitchen|ingredient|recipe'
+        ),
+        'healthy_drinks': (
+            r'drink|beverage|smoothie|juice|tea|water|healthy'
+            r'|hydration|nutrition|vitamin|antioxidant|wellness'
+        ),
+        'food_seasoning': (
+            r'season|spice|flavor|salt|pepper|herb|seasoning'
+            r'|taste|flavoring|condiment|marinade|sauce'
+        ),
+        'reasoning_about_object_functions': (
+            r'function|purpose|why|how|reason|logic|analysis'
+            r'|understanding|explanation|rationale|principle'
+        ),
+    }
+
     def __init__(self):
         """Initialize rule-based classifier."""
         self.allowed_topics = config.get_allowed_topics()
         self.topic_keywords = config.get_topic_keywords()
+
+        # Every topic gets a dense integer id; the hot scoring loop indexes
+        # plain lists by id instead of hashing topic-name strings on every
+        # lookup (~60 dict probes per document otherwise). Names are
+        # interned so downstream equality checks hit the pointer fast path.
+        self.topics = [sys.intern(topic) for topic in self.allowed_topics]
+        self.topic_id = {topic: i for i, topic in enumerate(self.topics)}
+
         self._compile_patterns()
         self._build_keyword_index()
-    
+
     def _compile_patterns(self):
-        """Compile regex patterns for topic detection."""
-        self.patterns = {}
-        
-        # Daily life tips patterns
-        self.patterns['daily_life_tips'] = [
-            re.compile(r'\b(?:tip|hack|advice|guide|how\s+to|life\s+hack|helpful|useful)\b', re.IGNORECASE),
-            re.compile(r'\b(?:easy|simple|quick|efficient|better|improve)\b', re.IGNORECASE),
-            re.compile(r'\b(?:everyday|daily|routine|habit|lifestyle)\b', re.IGNORECASE),
-        ]
-        
-        # Cooking techniques patterns
-        self.patterns['cooking_techniques'] = [
-            re.compile(r'\b(?:cook|recipe|bake|fry|boil|steam|grill|roast|sauté|simmer)\b', re.IGNORECASE),
-            re.compile(r'\b(?:technique|method|preparation|ingredient|seasoning)\b', re.IGNORECASE),
-            re.compile(r'\b(?:kitchen|culinary|chef|cooking|food)\b', re.IGNORECASE),
-        ]
-        
-        # Home care patterns
-        self.patterns['home_care'] = [
-            re.compile(r'\b(?:clean|maintain|repair|organize|home|house|household)\b', re.IGNORECASE),
-            re.compile(r'\b(?:maintenance|upkeep|care|preservation|storage)\b', re.IGNORECASE),
-            re.compile(r'\b(?:furniture|appliance|room|space|interior)\b', re.IGNORECASE),
-        ]
-        
-        # Object usage and actions patterns
-        self.patterns['object_usage_and_actions'] = [
-            re.compile(r'\b(?:use|operate|handle|manipulate|tool|device|gadget)\b', re.IGNORECASE),
-            re.compile(r'\b(?:function|purpose|application|utility|operation)\b', re.IGNORECASE),
-            re.compile(r'\b(?:instructions|manual|guide|directions)\b', re.IGNORECASE),
-        ]
-        
-        # Personal care patterns
-        self.patterns['personal_care'] = [
-            re.compile(r'\b(?:hygiene|grooming|health|wellness|self-care|skincare)\b', re.IGNORECASE),
-            re.compile(r'\b(?:beauty|cosmetic|personal|body|face|hair)\b', re.IGNORECASE),
-            re.compile(r'\b(?:routine|regimen|treatment|care|maintenance)\b', re.IGNORECASE),
-        ]
-        
-        # Healthy alternatives patterns
-        self.patterns['healthy_alternatives'] = [
-            re.compile(r'\b(?:healthy|alternative|substitute|natural|organic|wholesome)\b', re.IGNORECASE),
-            re.compile(r'\b(?:nutrition|nutritious|diet|wellness|health)\b', re.IGNORECASE),
-            re.compile(r'\b(?:replace|swap|instead|better|healthier)\b', re.IGNORECASE),
-        ]
-        
-        # Cleaning techniques patterns
-        self.patterns['cleaning_techniques'] = [
-            re.compile(r'\b(?:clean|wash|scrub|sanitize|disinfect|polish|wipe)\b', re.IGNORECASE),
-            re.compile(r'\b(?:cleaning|cleaner|detergent|soap|solution)\b', re.IGNORECASE),
-            re.compile(r'\b(?:stain|dirt|grime|mess|spot|residue)\b', re.IGNORECASE),
-        ]
-        
-        # Object placement patterns
-        self.patterns['object_placement'] = [
-            re.compile(r'\b(?:organize|arrange|place|position|store|storage)\b', re.IGNORECASE),
-            re.compile(r'\b(?:organization|arrangement|placement|layout|setup)\b', re.IGNORECASE),
-            re.compile(r'\b(?:shelf|cabinet|drawer|container|space)\b', re.IGNORECASE),
-        ]
-        
-        # Food handling patterns
-        self.patterns['food_handling'] = [
-            re.compile(r'\b(?:food\s+safety|handling|storage|preparation|preservation)\b', re.IGNORECASE),
-            re.compile(r'\b(?:fresh|spoilage|expiration|contamination|hygiene)\b', re.IGNORECASE),
-            re.compile(r'\b(?:refrigerate|freeze|store|keep|maintain)\b', re.IGNORECASE),
-        ]
-        
-        # Crafting and DIY patterns
-        self.patterns['crafting_and_diy'] = [
-            re.compile(r'\b(?:craft|diy|make|create|build|handmade|homemade)\b', re.IGNORECASE),
-            re.compile(r'\b(?:project|tutorial|instructions|materials|supplies)\b', re.IGNORECASE),
-            re.compile(r'\b(?:creative|artistic|design|decoration|decor)\b', re.IGNORECASE),
-        ]
-        
-        # Add patterns for remaining topics
-        self._add_remaining_patterns()
-    
-    def _add_remaining_patterns(self):
-        """Add patterns for remaining topics."""
-        # Odor removal patterns
-        self.patterns['odor_removal'] = [
-            re.compile(r'\b(?:odor|smell|deodorize|freshen|eliminate|neutralize)\b', re.IGNORECASE),
-            re.compile(r'\b(?:fragrance|scent|aroma|air\s+freshener|perfume)\b', re.IGNORECASE),
-        ]
-        
-        # Food preservation patterns
-        self.patterns['food_preservation'] = [
-            re.compile(r'\b(?:preserve|store|freeze|can|pickle|dry|cure)\b', re.IGNORECASE),
-            re.compile(r'\b(?:preservation|storage|shelf\s+life|expiration)\b', re.IGNORECASE),
-        ]
-        
-        # Object modification patterns
-        self.patterns['object_modification'] = [
-            re.compile(r'\b(?:modify|alter|customize|adapt|change|transform)\b', re.IGNORECASE),
-            re.compile(r'\b(?:modification|alteration|customization|upgrade)\b', re.IGNORECASE),
-        ]
-        
-        # Object storage patterns
-        self.patterns['object_storage'] = [
-            re.compile(r'\b(?:store|storage|organize|container|shelf|cabinet)\b', re.IGNORECASE),
-            re.compile(r'\b(?:organization|arrangement|space|room|closet)\b', re.IGNORECASE),
-        ]
-        
-        # Object shapes and functions patterns
-        self.patterns['object_shapes_and_functions'] = [
-            re.compile(r'\b(?:shape|function|purpose|design|form|structure)\b', re.IGNORECASE),
-            re.compile(r'\b(?:geometry|dimension|size|appearance|feature)\b', re.IGNORECASE),
-        ]
-        
-        # Food allergy substitutions patterns
-        self.patterns['food_allergy_substitutions'] = [
-            re.compile(r'\b(?:allergy|substitute|alternative|replace|intolerance)\b', re.IGNORECASE),
-            re.compile(r'\b(?:gluten-free|dairy-free|nut-free|vegan|substitution)\b', re.IGNORECASE),
-        ]
-        
-        # Personal hygiene patterns
-        self.patterns['personal_hygiene'] = [
-            re.compile(r'\b(?:hygiene|wash|brush|shower|clean|bathe)\b', re.IGNORECASE),
-            re.compile(r'\b(?:dental|oral|body|personal|cleanliness)\b', re.IGNORECASE),
-        ]
-        
-        # Carrying objects patterns
-        self.patterns['carrying_objects'] = [
-            re.compile(r'\b(?:carry|transport|move|lift|handle|grip)\b', re.IGNORECASE),
-            re.compile(r'\b(?:bag|container|holder|carrier|support)\b', re.IGNORECASE),
-        ]
-        
-        # Food preparation patterns
-        self.patterns['food_preparation'] = [
-            re.compile(r'\b(?:prep|prepare|chop|slice|mix|blend|combine)\b', re.IGNORECASE),
-            re.compile(r'\b(?:preparation|cooking|kitchen|ingredient|recipe)\b', re.IGNORECASE),
-        ]
-        
-        # Healthy drinks patterns
-        self.patterns['healthy_drinks'] = [
-            re.compile(r'\b(?:drink|beverage|smoothie|juice|tea|water|healthy)\b', re.IGNORECASE),
-            re.compile(r'\b(?:hydration|nutrition|vitamin|antioxidant|wellness)\b', re.IGNORECASE),
-        ]
-        
-        # Food seasoning patterns
-        self.patterns['food_seasoning'] = [
-            re.compile(r'\b(?:season|spice|flavor|salt|pepper|herb|seasoning)\b', re.IGNORECASE),
-            re.compile(r'\b(?:taste|flavoring|condiment|marinade|sauce)\b', re.IGNORECASE),
-        ]
-        
-        # Reasoning about object functions patterns
-        self.patterns['reasoning_about_object_functions'] = [
-            re.compile(r'\b(?:function|purpose|why|how|reason|logic|analysis)\b', re.IGNORECASE),
-            re.compile(r'\b(?:understanding|explanation|rationale|principle)\b', re.IGNORECASE),
-        ]
+        """Compile one fused regex per topic for topic detection.
+
+        The patterns only ever see already-lowered text, so they compile
+        case-sensitive; dropping IGNORECASE keeps the compiled programs
+        free of per-character case classes.
+        """
+        self.patterns = {
+            topic: _re_engine.compile(r'\b(?:%s)\b' % terms)
+            for topic, terms in self._TOPIC_TERMS.items()
+        }
+        # Id-indexed view for the scoring loop (None for topics with no
+        # pattern); avoids a string-keyed dict probe per topic per document
+        self.patterns_by_id = [self.patterns.get(topic) for topic in self.topics]
+
+        # Multi-pattern Hyperscan database over all topics: one scan of the
+        # document attributes matches back to topics via the pattern id.
+        self.hs_db = None
+        if HYPERSCAN_AVAILABLE:
+            try:
+                self.hs_topics = list(self._TOPIC_TERMS)
+                # Pattern id -> dense topic id (-1 for terms whose topic is
+                # not in the allowed list this run)
+                self.hs_topic_ids = [self.topic_id.get(topic, -1)
+                                     for topic in self.hs_topics]
+                expressions = [(r'\b(?:%s)\b' % self._TOPIC_TERMS[topic]).encode()
+                               for topic in self.hs_topics]
+                flags = (hyperscan.HS_FLAG_SOM_LEFTMOST
+                         | hyperscan.HS_FLAG_UTF8)
+                self.hs_db = hyperscan.Database()
+                self.hs_db.compile(
+                    expressions=expressions,
+                    ids=list(range(len(expressions))),
+                    flags=[flags] * len(expressions),
+                )
+                self.hs_scratch = hyperscan.Scratch(self.hs_db)
+            except Exception as e:
+                logger.warning(f"Hyperscan unavailable for topic patterns: {e}")
+                self.hs_db = None
+
+    def _scan_topic_patterns(self, text: str) -> Dict[int, List[str]]:
+        """Scan all topic patterns in one Hyperscan pass.
+
+        Returns:
+            Mapping of dense topic id to matched substrings
+        """
+        pattern_matches = defaultdict(list)
+        data = text.encode('utf-8')
+
+        def on_match(pattern_id, start, end, flags, context=None):
+            topic_id = self.hs_topic_ids[pattern_id]
+            if topic_id >= 0:
+                pattern_matches[topic_id].append(
+                    data[start:end].decode('utf-8', 'replace')
+                )
+
+        self.hs_db.scan(data, match_event_handler=on_match, scratch=self.hs_scratch)
+        return pattern_matches
     
     def _build_keyword_index(self):
         """Build keyword index for fast lookup."""
-        self.keyword_to_topics = {}
-        
+        index = defaultdict(list)
+
+        # Interning canonicalizes each distinct lowercase keyword to one
+        # str object: topics sharing a keyword ("clean", "health", ...)
+        # reference the same object, and the dedup set in the scoring path
+        # compares them by pointer before falling back to content.
         for topic, keywords in self.topic_keywords.items():
             for keyword in keywords:
-                keyword_lower = keyword.lower()
-                if keyword_lower not in self.keyword_to_topics:
-                    self.keyword_to_topics[keyword_lower] = []
-                self.keyword_to_topics[keyword_lower].append(topic)
+                index[sys.intern(keyword.lower())].append(topic)
+
+        # Freeze topic lists as dense-id tuples: immutable, built once here
+        # and shared by reference with the automaton payloads below.
+        self.keyword_to_topics = {
+            keyword: tuple(self.topic_id[topic]
+                           for topic in topics if topic in self.topic_id)
+            for keyword, topics in index.items()
+        }
+
+        # One Aho-Corasick automaton over every keyword. Its goto graph is
+        # a prefix-sharing trie ("clean"/"cleaner"/"cleaning" share nodes),
+        # and a single pass of the text reports all occurrences in
+        # O(len(text) + matches), replacing the per-topic
+        # `keyword in text` + str.count scans.
+        if self.keyword_to_topics:
+            self.keyword_automaton = ahocorasick.Automaton()
+            for keyword, topics in self.keyword_to_topics.items():
+                self.keyword_automaton.add_word(keyword, (keyword, topics))
+            self.keyword_automaton.make_automaton()
+        else:
+            self.keyword_automaton = None
+
+    def _find_keyword_matches(self, text: str) -> Dict[int, List[str]]:
+        """Find all keyword occurrences in text, grouped by topic id.
+
+        Hits are filtered to word boundaries so e.g. "clean" no longer
+        counts inside "cleanser", matching the \\b semantics of the
+        pattern scoring without an extra scan.
+        """
+        keyword_matches = defaultdict(list)
+
+        if self.keyword_automaton is not None:
+            text_len = len(text)
+            for end, (keyword, topic_ids) in self.keyword_automaton.iter(text):
+                start = end - len(keyword) + 1
+                if start > 0 and (text[start - 1].isalnum() or text[start - 1] == '_'):
+                    continue
+                after = end + 1
+                if after < text_len and (text[after].isalnum() or text[after] == '_'):
+                    continue
+                for topic_id in topic_ids:
+                    keyword_matches[topic_id].append(keyword)
+
+        return keyword_matches
     
-    def classify(self, title: str, content: str) -> ClassificationResult:
+    def classify(self, title: str, content: str,
+                 full_text: Optional[str] = None) -> ClassificationResult:
         """Classify content into allowed topics.
-        
+
         Args:
             title: Content title
             content: Content text
-            
+            full_text: Pre-lowered "title content" text, if the caller
+                already built it (avoids another O(n) pass)
+
         Returns:
             ClassificationResult
         """
         if not content:
-            return ClassificationResult(
-                topic=None,
-                confidence=0.0,
-                subdomain=None,
-                matched_keywords=[],
-                rule_score=0.0,
-                ml_score=None,
-                is_allowed=False,
-                rejection_reason="empty_content"
-            )
+            return _EMPTY_RESULT
         
         # Combine title and content for analysis
-        full_text = f"{title or ''} {content}".lower()
-        
-        # Calculate scores for each topic
-        topic_scores = {}
-        topic_keywords_matched = {}
-        
-        for topic in self.allowed_topics:
-            score, keywords = self._calculate_topic_score(topic, full_text)
-            topic_scores[topic] = score
-            topic_keywords_matched[topic] = keywords
-        
-        # Find best topic
-        if not topic_scores or max(topic_scores.values()) == 0:
-            return ClassificationResult(
-                topic=None,
-                confidence=0.0,
-                subdomain=None,
-                matched_keywords=[],
-                rule_score=0.0,
-                ml_score=None,
-                is_allowed=False,
-                rejection_reason="no_matching_topics"
+        if full_text is None:
+            full_text = f"{title or ''} {content}".lower()
+
+        # Normalization factor computed once per document instead of one
+        # math.log call + division per topic
+        word_count = _fast_word_count(full_text)
+        inv_norm = 1.0 / math.log(word_count + 1) if word_count > 0 else 0.0
+
+        # One automaton pass finds every keyword occurrence for all topics
+        keyword_matches = self._find_keyword_matches(full_text)
+
+        # One Hyperscan pass covers every topic pattern when available;
+        # otherwise each topic falls back to its own findall below
+        hs_matches = self._scan_topic_patterns(full_text) if self.hs_db is not None else None
+
+        # Per-topic hit counts collect into int32 arrays; the weighted
+        # sum and normalization run in one aggregation kernel below.
+        # Scores live in a fixed-size float32 array indexed by topic id:
+        # best and runner-up come from C-level argmax/partition instead of
+        # a Python-level max plus a full sort per document
+        n_topics = len(self.topics)
+        pattern_counts = np.zeros(n_topics, dtype=np.int32)
+        keyword_counts = np.zeros(n_topics, dtype=np.int32)
+        topic_keywords_matched = [None] * n_topics
+
+        for topic_id, pattern in enumerate(self.patterns_by_id):
+            topic_keywords_matched[topic_id] = self._collect_topic_matches(
+                topic_id, pattern, full_text,
+                keyword_matches.get(topic_id, []),
+                None if hs_matches is None else hs_matches.get(topic_id, []),
+                pattern_counts, keyword_counts
             )
-        
-        best_topic = max(topic_scores, key=topic_scores.get)
-        best_score = topic_scores[best_topic]
-        matched_keywords = topic_keywords_matched[best_topic]
-        
-        # Calculate confidence
-        confidence = self._calculate_confidence(best_score, topic_scores)
+
+        topic_scores = np.empty(n_topics, dtype=np.float32)
+        _aggregate_scores(pattern_counts, keyword_counts, inv_norm, topic_scores)
+
+        # Find best topic
+        if n_topics == 0:
+            return _NO_MATCH_RESULT
+
+        best_id = int(topic_scores.argmax())
+        best_score = float(topic_scores[best_id])
+        if best_score == 0:
+            return _NO_MATCH_RESULT
+
+        best_topic = self.topics[best_id]
+        matched_keywords = topic_keywords_matched[best_id]
+
+        # Calculate confidence from the top-two scores only
+        if n_topics > 1:
+            second_score = float(np.partition(topic_scores, -2)[-2])
+        else:
+            second_score = None
+        confidence = self._calculate_confidence(best_score, second_score)
         
         # Determine if content is allowed
         min_confidence = 0.3  # Minimum confidence threshold
@@ -271,85 +491,63 @@ class RuleBasedClassifier:
             rejection_reason=rejection_reason
         )
     
-    def _calculate_topic_score(self, topic: str, text: str) -> Tuple[float, List[str]]:
-        """Calculate score for a specific topic."""
-        score = 0.0
-        matched_keywords = []
-        
-        # Pattern matching
-        if topic in self.patterns:
-            for pattern in self.patterns[topic]:
-                matches = pattern.findall(text)
-                if matches:
-                    score += len(matches) * 2.0  # Weight for pattern matches
-                    matched_keywords.extend([match.lower() for match in matches])
-        
-        # Keyword matching
-        if topic in self.topic_keywords:
-            for keyword in self.topic_keywords[topic]:
-                keyword_lower = keyword.lower()
-                if keyword_lower in text:
-                    # Count occurrences
-                    count = text.count(keyword_lower)
-                    score += count * 1.0  # Weight for keyword matches
-                    matched_keywords.extend([keyword_lower] * count)
-        
-        # Normalize score by text length
-        text_words = len(text.split())
-        if text_words > 0:
-            score = score / math.log(text_words + 1)  # Logarithmic normalization
-        
-        return score, list(set(matched_keywords))
+    def _collect_topic_matches(self, topic_id: int, pattern, text: str,
+                               keyword_matches: List[str],
+                               pattern_matches: Optional[List[str]],
+                               pattern_counts: np.ndarray,
+                               keyword_counts: np.ndarray) -> List[str]:
+        """Collect one topic's matches and record their counts.
+
+        The counts feed the shared _aggregate_scores kernel; only the
+        deduplicated matched strings are returned.
+
+        Args:
+            topic_id: Dense topic id (index into the count arrays)
+            pattern: The topic's compiled fused pattern (or None)
+            text: Lowercased full text
+            keyword_matches: This topic's keyword hits from the automaton pass
+            pattern_matches: This topic's hits from the shared Hyperscan
+                pass, or None to scan with the topic's own pattern
+            pattern_counts: int32 per-topic pattern-hit counts (written)
+            keyword_counts: int32 per-topic keyword-hit counts (written)
+        """
+        # Matches come off the already-lowered text, so they go straight
+        # into the dedup set without re-lowering or intermediate lists
+        matched_keywords = set()
+
+        # Pattern matching: one scan over the fused alternation (or the
+        # pre-computed hits from the shared Hyperscan pass)
+        if pattern_matches is None and pattern is not None:
+            pattern_matches = pattern.findall(text)
+        if pattern_matches:
+            pattern_counts[topic_id] = len(pattern_matches)
+            matched_keywords.update(pattern_matches)
+
+        # Keyword matching (pre-computed by the shared automaton pass)
+        if keyword_matches:
+            keyword_counts[topic_id] = len(keyword_matches)
+            matched_keywords.update(keyword_matches)
+
+        return list(matched_keywords)
     
-    def _calculate_confidence(self, best_score: float, all_scores: Dict[str, float]) -> float:
-        """Calculate confidence based on score distribution."""
-        if not all_scores:
-            return 0.0
-        
-        scores = list(all_scores.values())
-        scores.sort(reverse=True)
-        
-        if len(scores) == 1:
+    def _calculate_confidence(self, best_score: float,
+                              second_score: Optional[float]) -> float:
+        """Calculate confidence from the best and second-best scores."""
+        if second_score is None:
             return min(best_score / 10.0, 1.0)  # Single topic
-        
+
         # Calculate confidence based on score separation
-        if scores[1] == 0:
+        if second_score == 0:
             confidence = min(best_score / 5.0, 1.0)
         else:
-            score_ratio = best_score / scores[1]
+            score_ratio = best_score / second_score
             confidence = min(score_ratio / 3.0, 1.0)
-        
+
         return max(0.0, min(1.0, confidence))
     
     def _get_subdomain(self, topic: str) -> str:
         """Get subdomain for a topic."""
-        # Map topics to more specific subdomains
-        subdomain_mapping = {
-            'daily_life_tips': 'general_tips',
-            'cooking_techniques': 'culinary_skills',
-            'home_care': 'household_maintenance',
-            'object_usage_and_actions': 'tool_usage',
-            'personal_care': 'self_maintenance',
-            'healthy_alternatives': 'health_choices',
-            'cleaning_techniques': 'sanitation_methods',
-            'object_placement': 'organization_systems',
-            'food_handling': 'food_safety',
-            'crafting_and_diy': 'creative_projects',
-            'odor_removal': 'scent_management',
-            'food_preservation': 'food_storage',
-            'object_modification': 'item_customization',
-            'object_storage': 'storage_solutions',
-            'object_shapes_and_functions': 'design_analysis',
-            'food_allergy_substitutions': 'dietary_alternatives',
-            'personal_hygiene': 'cleanliness_practices',
-            'carrying_objects': 'transport_methods',
-            'food_preparation': 'cooking_prep',
-            'healthy_drinks': 'beverage_wellness',
-            'food_seasoning': 'flavor_enhancement',
-            'reasoning_about_object_functions': 'functional_analysis'
-        }
-        
-        return subdomain_mapping.get(topic, topic)
+        return _SUBDOMAIN_MAPPING.get(topic, topic)
 
 
 class TopicClassifier:
@@ -359,7 +557,17 @@ class TopicClassifier:
         """Initialize topic classifier."""
         self.rule_classifier = RuleBasedClassifier()
         self.allowed_topics = config.get_allowed_topics()
-        
+
+        # The rule classifier is pure CPU work; running it on the event
+        # loop stalls every in-flight fetch for the full scan. A shared
+        # thread pool keeps the loop responsive, and the re2/Hyperscan
+        # scanners release the GIL while matching, so documents classify
+        # in parallel across cores.
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1),
+            thread_name_prefix='classifier'
+        )
+
         # Rejection tracking
         self.rejection_stats = Counter()
     
@@ -375,47 +583,42 @@ class TopicClassifier:
         Returns:
             ClassificationResult
         """
-        # Primary rule-based classification
-        result = self.rule_classifier.classify(title, content)
-        
-        # Additional validation checks
-        if result.is_allowed:
-            result = self._validate_classification(result, title, content, metadata)
-        
+        # Lower the combined text once; classification and validation share it
+        full_text = f"{title or ''} {content}".lower()
+
+        # Cheap rejection filters run first: documents hitting an excluded
+        # term (or too short to keep) skip the full scoring pass entirely,
+        # which is the common case on a reject-heavy crawl
+        if not content:
+            result = _EMPTY_RESULT
+        elif len(content.strip()) < 100:
+            result = _LOW_QUALITY_RESULT
+        elif _EXCLUSION_RE.search(full_text):
+            result = _EXCLUDED_RESULT
+        else:
+            # Primary rule-based classification, off the event loop
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                self._executor, self.rule_classifier.classify, title, content, full_text
+            )
+
+            # Additional validation checks
+            if result.is_allowed:
+                result = self._validate_classification(result, title, content, metadata)
+
         # Track rejections
         if not result.is_allowed:
             self.rejection_stats[result.rejection_reason] += 1
-        
+
         return result
     
-    def _validate_classification(self, result: ClassificationResult, title: str, 
+    def _validate_classification(self, result: ClassificationResult, title: str,
                                content: str, metadata: Optional[Dict] = None) -> ClassificationResult:
-        """Validate and refine classification result."""
-        # Check for explicit exclusions
-        exclusion_patterns = [
-            re.compile(r'\b(?:news|politics|election|government|war|violence)\b', re.IGNORECASE),
-            re.compile(r'\b(?:celebrity|gossip|entertainment|movie|tv\s+show)\b', re.IGNORECASE),
-            re.compile(r'\b(?:sports|game|match|tournament|league)\b', re.IGNORECASE),
-            re.compile(r'\b(?:investment|stock|crypto|finance|money|business)\b', re.IGNORECASE),
-            re.compile(r'\b(?:medical|diagnosis|treatment|prescription|drug)\b', re.IGNORECASE),
-            re.compile(r'\b(?:legal|law|court|lawsuit|attorney)\b', re.IGNORECASE),
-        ]
-        
-        full_text = f"{title or ''} {content}".lower()
-        
-        for pattern in exclusion_patterns:
-            if pattern.search(full_text):
-                return ClassificationResult(
-                    topic=None,
-                    confidence=0.0,
-                    subdomain=None,
-                    matched_keywords=result.matched_keywords,
-                    rule_score=result.rule_score,
-                    ml_score=result.ml_score,
-                    is_allowed=False,
-                    rejection_reason="excluded_topic"
-                )
-        
+        """Validate and refine classification result.
+
+        Exclusion filtering happens up front in classify_content now; only
+        the quality checks that need the classified result remain here.
+        """
         # Check content quality indicators
         if self._is_low_quality_content(content):
             return ClassificationResult(
@@ -435,33 +638,32 @@ class TopicClassifier:
         """Check if content appears to be low quality."""
         if not content or len(content.strip()) < 100:
             return True
-        
-        # Check for excessive promotional content
-        promo_patterns = [
-            re.compile(r'\b(?:buy|purchase|order|sale|discount|offer|deal)\b', re.IGNORECASE),
-            re.compile(r'\b(?:click|visit|website|link|url|www)\b', re.IGNORECASE),
-            re.compile(r'\b(?:affiliate|sponsored|advertisement|promo)\b', re.IGNORECASE),
-        ]
-        
-        promo_matches = 0
-        for pattern in promo_patterns:
-            promo_matches += len(pattern.findall(content))
-        
-        words = len(content.split())
-        if words > 0 and promo_matches / words > 0.1:  # More than 10% promotional content
-            return True
-        
+
+        # Cheap checks first so obviously-bad content skips the regex scan
+
         # Check for excessive capitalization
-        if content.isupper() and len(content) > 50:
+        if len(content) > 50 and content.isupper():
             return True
-        
+
+        # Lowered once here, after the case-sensitive isupper check; the
+        # repetition and promo checks below both run on the lowered text
+        lowered = content.lower()
+
         # Check for spam-like repetition
-        sentences = content.split('.')
+        sentences = lowered.split('.')
         if len(sentences) > 3:
-            unique_sentences = len(set(s.strip().lower() for s in sentences))
+            unique_sentences = len(set(s.strip() for s in sentences))
             if unique_sentences / len(sentences) < 0.7:  # Less than 70% unique sentences
                 return True
-        
+
+        # Check for excessive promotional content (integer compare avoids
+        # the float division): more than 10% promotional words
+        words = _fast_word_count(lowered)
+        if words > 0:
+            promo_matches = len(_PROMO_RE.findall(lowered))
+            if promo_matches * 10 > words:
+                return True
+
         return False
     
     def get_classification_stats(self) -> Dict[str, Any]:
@@ -492,6 +694,6 @@ class TopicClassifier:
             'topic': topic,
             'subdomain': self.rule_classifier._get_subdomain(topic),
             'keywords': self.rule_classifier.topic_keywords.get(topic, []),
-            'patterns': len(self.rule_classifier.patterns.get(topic, [])),
+            'patterns': 1 if topic in self.rule_classifier.patterns else 0,
             'is_allowed': True
         } 
\ No newline at end of file
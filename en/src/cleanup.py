@@ -0,0 +1,45 @@
+"""
+Standalone cleanup of old crawl data.
+
+The CLI ``cleanup`` command used to construct a full CrawlingPipeline
+(fetchers, extractor, classifier, dedup system, exporter) just to issue
+two SQL DELETEs. These free functions work straight against a
+DatabaseManager so the command stays in the millisecond range.
+"""
+import logging
+from datetime import datetime, timedelta
+
+from .models import DeduplicationIndex, FrontierURL
+
+logger = logging.getLogger(__name__)
+
+
+async def cleanup_old_data(db_manager, days: int = 30) -> int:
+    """Delete old frontier URLs and deduplication entries.
+
+    Note: this skips the FAISS index rebuild the full pipeline performs
+    after pruning dedup entries; the next pipeline run rebuilds it.
+
+    Args:
+        db_manager: Database manager instance
+        days: Number of days of data to keep
+
+    Returns:
+        Total number of rows deleted
+    """
+    cutoff_date = datetime.utcnow() - timedelta(days=days)
+
+    with db_manager.get_session() as session:
+        deleted_urls = session.query(FrontierURL).filter(
+            FrontierURL.status.in_(['completed', 'failed']),
+            FrontierURL.last_attempted < cutoff_date
+        ).delete()
+
+        deleted_dedupe = session.query(DeduplicationIndex).filter(
+            DeduplicationIndex.created_at < cutoff_date
+        ).delete()
+
+        session.commit()
+
+    logger.info(f"Cleaned up {deleted_urls} old URLs and {deleted_dedupe} dedup entries")
+    return deleted_urls + deleted_dedupe
@@ -2,7 +2,14 @@
 Configuration management system with YAML loading and environment overrides.
 """
 import os
+import types
 import yaml
+# libyaml-backed C parser when the wheel ships it; safe_load's default
+# pure-Python SafeLoader otherwise. Same safe construction rules.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 from typing import Dict, Any, Optional
 from pathlib import Path
 from dotenv import load_dotenv
@@ -10,6 +17,10 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Sentinel for memoized lookups that resolved to "key not present", so the
+# per-call default can still be applied without re-walking the dict.
+_MISSING = object()
+
 
 class ConfigManager:
     """Manages configuration loading from YAML with environment overrides."""
@@ -28,12 +39,27 @@ class ConfigManager:
         self.config_path = Path(config_path)
         self.config = self._load_config()
         self._apply_env_overrides()
-        
+        self._get_cache: Dict[str, Any] = {}
+        self.hot = self._build_hot_snapshot()
+
+    def _build_hot_snapshot(self) -> types.SimpleNamespace:
+        """Snapshot the per-document hot keys as plain attributes.
+
+        The cleaning path reads these once per processed document;
+        attribute access skips even the memoized get()'s dict probe.
+        Rebuilt on reload().
+        """
+        return types.SimpleNamespace(
+            content_min_length=self.get('content.min_length', 200),
+            content_max_consecutive_linebreaks=self.get('content.max_consecutive_linebreaks', 1),
+            content_remove_emojis=self.get('content.remove_emojis', True),
+        )
+
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         try:
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YamlLoader)
             logger.info(f"Loaded configuration from {self.config_path}")
             return config
         except FileNotFoundError:
@@ -120,15 +146,21 @@ class ConfigManager:
         Returns:
             Configuration value or default
         """
-        keys = key_path.split('.')
-        current = self.config
-        
-        try:
-            for key in keys:
-                current = current[key]
-            return current
-        except (KeyError, TypeError):
-            return default
+        # Memoize resolution per key path: the same handful of dotted keys
+        # are looked up repeatedly per run, and each lookup pays a split()
+        # plus a nested dict walk. The cache is invalidated on reload().
+        value = self._get_cache.get(key_path, _MISSING)
+        if value is _MISSING and key_path not in self._get_cache:
+            current = self.config
+            try:
+                for key in key_path.split('.'):
+                    current = current[key]
+                value = current
+            except (KeyError, TypeError):
+                value = _MISSING
+            self._get_cache[key_path] = value
+
+        return default if value is _MISSING else value
     
     def get_crawler_config(self) -> Dict[str, Any]:
         """Get crawler-specific configuration."""
@@ -178,8 +210,18 @@ class ConfigManager:
         """Reload configuration from file."""
         self.config = self._load_config()
         self._apply_env_overrides()
+        self._get_cache.clear()
+        self.hot = self._build_hot_snapshot()
         logger.info("Configuration reloaded")
 
 
-# Global configuration instance
-config = ConfigManager() 
\ No newline at end of file
+# Global configuration instance, materialized lazily (PEP 562): merely
+# importing this module no longer runs load_dotenv(), opens and parses
+# the YAML file, or walks the environment. `from .config import config`
+# keeps working and pays the cost on first access.
+def __getattr__(name):
+    if name == 'config':
+        global config
+        config = ConfigManager()
+        return config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
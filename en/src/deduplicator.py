@@ -7,18 +7,150 @@ from typing import Dict, List, Optional, Tuple, Any, Set
 from dataclasses import dataclass
 import re
 import math
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 
 import numpy as np
 from simhash import Simhash
 from sentence_transformers import SentenceTransformer
 import faiss
 
+# simsimd dispatches batch Hamming distance to AVX2/AVX-512 popcount
+# kernels at runtime. Optional: the numpy unpackbits path below is the
+# fallback.
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    SIMSIMD_AVAILABLE = False
+
+# Dedup keying needs collision resistance, not a cryptographic
+# commitment: blake3 (SIMD, multiple GB/s) or xxh3_128 outrun scalar
+# sha256 by 5-15x on long documents. Both optional; sha256 remains the
+# fallback and stays on the cold embedding-hash path.
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Numba-compiled Hamming scan (parallel SWAR popcount, cached on disk);
+# sits between simsimd and the numpy unpackbits fallback.
+try:
+    from ._simd_kernels import hamming_scan as _hamming_scan
+    NUMBA_KERNELS_AVAILABLE = True
+except ImportError:
+    NUMBA_KERNELS_AVAILABLE = False
+
+# Bloom filter fronting the exact-hash DB lookup: a negative probe is a
+# few memory reads, and most checks are negatives. Optional; without it
+# every check pays the SQL round-trip as before.
+try:
+    from pybloom_live import ScalableBloomFilter
+    BLOOM_AVAILABLE = True
+except ImportError:
+    BLOOM_AVAILABLE = False
+
 from .config import config
 from .models import DatabaseManager
 
 logger = logging.getLogger(__name__)
 
+# Reserved doc_id of the marker row that records which fingerprint
+# family (md5-based Simhash vs the xxh64 fast path) the stored simhash
+# corpus was built with. Distances across families are noise, so the
+# detector pins itself to the stored family instead of silently mixing.
+_SIMHASH_ALGO_MARKER = '__simhash_algo__'
+
+# Normalization patterns compile once at import; the per-document re.*
+# calls were paying the module-cache lookup on every sub-millisecond
+# document.
+_RE_WS = re.compile(r'\s+')
+_RE_PUNCT = re.compile(r'[^\w\s]')
+_RE_WORD = re.compile(r'\b\w+\b')
+
+
+def _hamming_distances(query: int, hashes: np.ndarray) -> np.ndarray:
+    """Hamming distances between a 64-bit query and a vector of hashes.
+
+    One vectorized XOR plus a bit-unpack/sum popcount over the whole
+    candidate set, instead of a Python-level parse/xor/bin-count per
+    candidate.
+
+    Args:
+        query: Query simhash as a 64-bit integer
+        hashes: Candidate simhashes as a np.uint64 array
+
+    Returns:
+        Per-candidate bit distances (0..64)
+    """
+    if SIMSIMD_AVAILABLE:
+        # Bit-level Hamming over the raw 8-byte rows, SIMD popcount per
+        # lane; no intermediate XOR array at the Python level
+        query_row = np.array([query], dtype=np.uint64).view(np.uint8).reshape(1, 8)
+        candidate_rows = hashes.view(np.uint8).reshape(-1, 8)
+        return np.asarray(
+            simsimd.cdist(query_row, candidate_rows, metric='hamming'),
+            dtype=np.int64
+        ).ravel()
+
+    if NUMBA_KERNELS_AVAILABLE:
+        out = np.empty(hashes.shape[0], dtype=np.uint8)
+        _hamming_scan(np.uint64(query), hashes, out)
+        return out
+
+    xor = hashes ^ np.uint64(query)
+    return np.unpackbits(xor.view(np.uint8)).reshape(-1, 64).sum(axis=1)
+
+
+def _numpy_simhash(tokens: List[str]) -> int:
+    """Compute a 64-bit simhash over the tokens in one vectorized tally.
+
+    Hashes every token with xxh64, unpacks all hashes into an
+    (n_tokens, 64) bit matrix and takes the per-column majority vote —
+    the same fingerprint construction Simhash() performs with per-token
+    MD5 digests and a Python counter loop.
+
+    Args:
+        tokens: Feature strings (unit weight each)
+
+    Returns:
+        Simhash value as a 64-bit integer
+    """
+    hashes = np.fromiter(
+        (xxhash.xxh64_intdigest(token) for token in tokens),
+        dtype=np.uint64, count=len(tokens)
+    )
+    bits = np.unpackbits(hashes.view(np.uint8), bitorder='little').reshape(-1, 64)
+    sums = bits.sum(axis=0, dtype=np.int64)
+    majority = (2 * sums) > len(tokens)
+    return int(np.packbits(majority, bitorder='little').view(np.uint64)[0])
+
+
+def _content_digest(data: bytes) -> str:
+    """Fingerprint content bytes with the fastest available hash.
+
+    Hashes from different algorithms never collide with each other in
+    practice, so mixing algorithms across a corpus only costs missed
+    matches against rows written before an algorithm change.
+
+    Args:
+        data: Content bytes
+
+    Returns:
+        Hex digest string
+    """
+    if BLAKE3_AVAILABLE:
+        return blake3.blake3(data).hexdigest()
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.sha256(data).hexdigest()
+
 
 @dataclass
 class DuplicateResult:
@@ -40,7 +172,52 @@ class ExactDuplicateDetector:
             db_manager: Database manager instance
         """
         self.db_manager = db_manager
-    
+
+        # Membership filter over every stored exact hash; "not in the
+        # filter" is definitive, so only probable hits touch the DB
+        self.bloom = None
+        if BLOOM_AVAILABLE:
+            self.bloom = ScalableBloomFilter(
+                initial_capacity=1_000_000, error_rate=1e-4
+            )
+            try:
+                self._prewarm_filter()
+            except Exception as e:
+                logger.warning(f"Failed to prewarm exact-hash filter: {e}")
+                self.bloom = None
+
+    def _prewarm_filter(self):
+        """Load every stored exact hash into the Bloom filter."""
+        count = 0
+        with self.db_manager.get_session() as session:
+            from .models import DeduplicationIndex
+
+            for (content_hash,) in session.query(DeduplicationIndex.exact_hash):
+                if content_hash:
+                    self.bloom.add(content_hash)
+                    count += 1
+
+        if count:
+            logger.info(f"Prewarmed exact-hash filter with {count} entries")
+
+    def register_hash(self, content_hash: str):
+        """Record a newly stored exact hash in the Bloom filter."""
+        if self.bloom is not None and content_hash:
+            self.bloom.add(content_hash)
+
+    def rebuild_filter(self):
+        """Rebuild the Bloom filter from the database (after deletes)."""
+        if not BLOOM_AVAILABLE:
+            return
+        self.bloom = ScalableBloomFilter(
+            initial_capacity=1_000_000, error_rate=1e-4
+        )
+        try:
+            self._prewarm_filter()
+        except Exception as e:
+            logger.warning(f"Failed to rebuild exact-hash filter: {e}")
+            self.bloom = None
+
     def generate_content_hash(self, content: str) -> str:
         """Generate hash for content.
         
@@ -48,31 +225,32 @@ class ExactDuplicateDetector:
             content: Content text
             
         Returns:
-            SHA-256 hash of normalized content
+            Hex digest of normalized content
         """
         if not content:
             return ""
         
         # Normalize content for hashing
         normalized = self._normalize_for_hashing(content)
-        
-        # Generate SHA-256 hash
-        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+        return _content_digest(normalized.encode('utf-8'))
     
     def _normalize_for_hashing(self, content: str) -> str:
         """Normalize content for consistent hashing."""
         # Convert to lowercase
         normalized = content.lower()
-        
+
         # Remove extra whitespace
-        normalized = re.sub(r'\s+', ' ', normalized)
-        
-        # Remove punctuation for more flexible matching
-        normalized = re.sub(r'[^\w\s]', '', normalized)
-        
+        normalized = _RE_WS.sub(' ', normalized)
+
+        # Remove punctuation for more flexible matching (kept as a
+        # separate pass after the whitespace collapse so existing stored
+        # hashes stay reproducible)
+        normalized = _RE_PUNCT.sub('', normalized)
+
         # Strip whitespace
         normalized = normalized.strip()
-        
+
         return normalized
     
     def is_exact_duplicate(self, content: str) -> Tuple[bool, Optional[str]]:
@@ -85,10 +263,15 @@ class ExactDuplicateDetector:
             Tuple of (is_duplicate, duplicate_doc_id)
         """
         content_hash = self.generate_content_hash(content)
-        
+
         if not content_hash:
             return False, None
-        
+
+        # Bloom negatives are definitive; skip the DB round-trip on the
+        # common not-a-duplicate path
+        if self.bloom is not None and content_hash not in self.bloom:
+            return False, None
+
         # Check database for existing hash
         is_duplicate = self.db_manager.is_content_duplicate(content_hash)
         
@@ -117,8 +300,109 @@ class SimhashDuplicateDetector:
         """
         self.db_manager = db_manager
         self.similarity_threshold = similarity_threshold
-        self.simhash_cache = {}
-    
+
+        # In-process simhash corpus: doc ids alongside a preallocated
+        # np.uint64 array (doubled on growth), so the candidate scan
+        # runs on memory the process already holds instead of paying a
+        # SQL round-trip per check_duplicate call.
+        self._doc_ids: List[str] = []
+        self._hash_array = np.empty(1024, dtype=np.uint64)
+        self._count = 0
+
+        # Pin the fingerprint algorithm to the stored corpus's family
+        self._algo = 'md5'
+        try:
+            self._algo = self._resolve_algo()
+        except Exception as e:
+            logger.warning(f"Failed to resolve simhash algorithm: {e}")
+
+        if self._algo == 'xxh64' and not XXHASH_AVAILABLE:
+            logger.warning(
+                "Stored simhash corpus is xxh64-fingerprinted but xxhash is "
+                "not installed; simhash detection is inactive until it is"
+            )
+
+        try:
+            self._prewarm_cache()
+        except Exception as e:
+            logger.warning(f"Failed to prewarm simhash cache: {e}")
+
+    def _resolve_algo(self) -> str:
+        """Pin the fingerprint algorithm to the stored corpus's family.
+
+        Returns 'xxh64' or 'md5'. A corpus with simhash rows but no
+        marker predates the marker scheme and was fingerprinted by the
+        md5-based Simhash path; an empty corpus adopts the preferred
+        algorithm and records it in a marker row.
+        """
+        with self.db_manager.get_session() as session:
+            from .models import DeduplicationIndex
+
+            marker = session.query(DeduplicationIndex).filter(
+                DeduplicationIndex.doc_id == _SIMHASH_ALGO_MARKER
+            ).first()
+            if marker is not None and marker.simhash in ('md5', 'xxh64'):
+                return marker.simhash
+
+            has_rows = session.query(DeduplicationIndex).filter(
+                DeduplicationIndex.simhash.isnot(None)
+            ).first() is not None
+
+        algo = 'md5' if has_rows else ('xxh64' if XXHASH_AVAILABLE else 'md5')
+        self.db_manager.add_deduplication_entry(
+            doc_id=_SIMHASH_ALGO_MARKER,
+            exact_hash=_SIMHASH_ALGO_MARKER,
+            simhash=algo
+        )
+        return algo
+
+    def _prewarm_cache(self, limit: int = 100000):
+        """Load the most recent stored simhashes into the corpus."""
+        with self.db_manager.get_session() as session:
+            from .models import DeduplicationIndex
+
+            entries = session.query(DeduplicationIndex).filter(
+                DeduplicationIndex.simhash.isnot(None),
+                DeduplicationIndex.doc_id != _SIMHASH_ALGO_MARKER
+            ).order_by(DeduplicationIndex.created_at.desc()).limit(limit).all()
+
+        # Oldest first, so appends keep insertion order
+        for entry in reversed(entries):
+            self.add_hash(entry.doc_id, entry.simhash)
+
+        if self._count:
+            logger.info(f"Prewarmed simhash cache with {self._count} entries")
+
+    def add_hash(self, doc_id: str, simhash_hex: str):
+        """Register a stored simhash in the in-memory corpus.
+
+        Args:
+            doc_id: Document ID
+            simhash_hex: Simhash as hexadecimal string
+        """
+        if not simhash_hex:
+            return
+        try:
+            value = int(simhash_hex, 16)
+        except ValueError:
+            return
+
+        if self._count == len(self._hash_array):
+            grown = np.empty(len(self._hash_array) * 2, dtype=np.uint64)
+            grown[:self._count] = self._hash_array
+            self._hash_array = grown
+
+        self._hash_array[self._count] = value
+        self._doc_ids.append(doc_id)
+        self._count += 1
+
+    def rebuild_cache(self):
+        """Reload the corpus from the database (after bulk deletes)."""
+        self._doc_ids = []
+        self._hash_array = np.empty(1024, dtype=np.uint64)
+        self._count = 0
+        self._prewarm_cache()
+
     def generate_simhash(self, content: str) -> str:
         """Generate simhash for content.
         
@@ -136,34 +420,34 @@ class SimhashDuplicateDetector:
         
         if not tokens:
             return ""
-        
-        # Generate simhash
-        simhash = Simhash(tokens)
-        return format(simhash.value, '016x')
+
+        # Stay on the fingerprint family the stored corpus was built
+        # with (pinned by the marker row): xxh64 drives the vectorized
+        # bit tally, md5 the legacy Simhash path. If the pinned family
+        # cannot be computed, emit nothing rather than a fingerprint
+        # from the wrong family.
+        if self._algo == 'xxh64':
+            if not XXHASH_AVAILABLE:
+                return ""
+            value = _numpy_simhash(tokens)
+        else:
+            value = Simhash(tokens).value
+        return format(value, '016x')
     
     def _tokenize_content(self, content: str) -> List[str]:
         """Tokenize content for simhash generation."""
-        # Convert to lowercase and normalize whitespace
-        normalized = re.sub(r'\s+', ' ', content.lower().strip())
-        
-        # Extract words
-        words = re.findall(r'\b\w+\b', normalized)
-        
-        # Generate n-grams (1-grams, 2-grams, 3-grams)
-        tokens = []
-        
-        # Add words (1-grams)
-        tokens.extend(words)
-        
-        # Add 2-grams
-        for i in range(len(words) - 1):
-            tokens.append(f"{words[i]} {words[i+1]}")
-        
-        # Add 3-grams
-        for i in range(len(words) - 2):
-            tokens.append(f"{words[i]} {words[i+1]} {words[i+2]}")
-        
-        return tokens
+        # Extract lowercased words; the word pattern is whitespace-
+        # agnostic, so the old separate whitespace-collapse pass was a
+        # full extra traversal for nothing
+        words = _RE_WORD.findall(content.lower())
+
+        # Generate n-grams (1-grams, 2-grams, 3-grams). zip pairs the
+        # shifted views directly, replacing the index-arithmetic loops
+        # and their per-iteration bounds checks.
+        bigrams = [f"{a} {b}" for a, b in zip(words, words[1:])]
+        trigrams = [f"{a} {b} {c}" for a, b, c in zip(words, words[1:], words[2:])]
+
+        return words + bigrams + trigrams
     
     def calculate_simhash_similarity(self, hash1: str, hash2: str) -> float:
         """Calculate similarity between two simhashes.
@@ -183,9 +467,10 @@ class SimhashDuplicateDetector:
             int1 = int(hash1, 16)
             int2 = int(hash2, 16)
             
-            # Calculate Hamming distance
-            xor = int1 ^ int2
-            hamming_distance = bin(xor).count('1')
+            # Calculate Hamming distance. int.bit_count() (3.10+) is a
+            # single C-level popcount; bin().count('1') allocated and
+            # scanned a 66-char string per call.
+            hamming_distance = (int1 ^ int2).bit_count()
             
             # Convert to similarity (64 bits total for simhash)
             similarity = 1.0 - (hamming_distance / 64.0)
@@ -206,30 +491,31 @@ class SimhashDuplicateDetector:
             List of (doc_id, similarity_score) tuples
         """
         content_simhash = self.generate_simhash(content)
-        
+
         if not content_simhash:
             return []
-        
-        candidates = []
-        
-        # Get simhashes from database
-        with self.db_manager.get_session() as session:
-            from .models import DeduplicationIndex
-            
-            # Get recent simhashes for comparison
-            entries = session.query(DeduplicationIndex).filter(
-                DeduplicationIndex.simhash.isnot(None)
-            ).order_by(DeduplicationIndex.created_at.desc()).limit(max_candidates).all()
-            
-            for entry in entries:
-                if entry.simhash:
-                    similarity = self.calculate_simhash_similarity(content_simhash, entry.simhash)
-                    if similarity >= self.similarity_threshold:
-                        candidates.append((entry.doc_id, similarity))
-        
+
+        if not self._count:
+            return []
+
+        query = int(content_simhash, 16)
+
+        # Scan the most recent max_candidates entries of the in-memory
+        # corpus (matching the old created_at-ordered DB query) in one
+        # vectorized XOR+popcount pass; the similarity threshold becomes
+        # a bit-distance cutoff
+        start = max(0, self._count - max_candidates)
+        distances = _hamming_distances(query, self._hash_array[start:self._count])
+        max_distance = int(64.0 * (1.0 - self.similarity_threshold))
+
+        candidates = [
+            (self._doc_ids[start + i], 1.0 - float(distances[i]) / 64.0)
+            for i in np.nonzero(distances <= max_distance)[0]
+        ]
+
         # Sort by similarity
         candidates.sort(key=lambda x: x[1], reverse=True)
-        
+
         return candidates
 
 
@@ -260,14 +546,57 @@ class EmbeddingDuplicateDetector:
         # Initialize FAISS index
         self.faiss_index = None
         self.doc_id_map = {}  # Maps FAISS index to doc_id
+        self._pending = []  # (doc_id, embedding) buffered until IVFPQ trains
+        self.ivfpq_train_size = config.get('deduplication.ivfpq_train_size', 4096)
+        self.quantize = config.get('deduplication.quantize', 'none')
         self._initialize_faiss_index()
-    
+
+        # LRU of recent embeddings keyed by content fingerprint: re-crawls
+        # and check_duplicate-then-add_document hit the encoder with the
+        # same content twice, and a dict probe is orders of magnitude
+        # cheaper than a transformer forward pass.
+        self._emb_cache: OrderedDict = OrderedDict()
+        self._emb_cache_size = 10000
+
     def _initialize_faiss_index(self):
-        """Initialize FAISS index for similarity search."""
+        """Initialize FAISS index for similarity search.
+
+        deduplication.ann_index picks the structure: 'flat' (exact,
+        O(N*D) scan), 'hnsw' (graph ANN, sub-ms queries at million
+        scale) or 'ivfpq' (coarse quantizer + 16-byte PQ codes, ~24x
+        less RAM). The ANN variants trade a little recall for latency
+        and memory; vectors are normalized, so inner product is cosine
+        throughout.
+        """
         try:
-            # Create FAISS index for cosine similarity
-            self.faiss_index = faiss.IndexFlatIP(self.embedding_dim)
-            logger.info(f"Initialized FAISS index with dimension {self.embedding_dim}")
+            ann_type = config.get('deduplication.ann_index', 'flat')
+            if self.quantize == 'binary':
+                # Sign-quantized embeddings: 1 bit per dimension (48
+                # bytes at 384-d vs 1536 for float32), scored by XOR +
+                # popcount Hamming. Plenty of recall for the >0.95
+                # near-duplicate band this detector operates in.
+                if ann_type == 'hnsw':
+                    index = faiss.IndexBinaryHNSW(self.embedding_dim, 32)
+                else:
+                    index = faiss.IndexBinaryFlat(self.embedding_dim)
+            elif ann_type == 'hnsw':
+                index = faiss.IndexHNSWFlat(self.embedding_dim, 32, faiss.METRIC_INNER_PRODUCT)
+                index.hnsw.efConstruction = 200
+                index.hnsw.efSearch = 64
+            elif ann_type == 'ivfpq':
+                quantizer = faiss.IndexFlatIP(self.embedding_dim)
+                index = faiss.IndexIVFPQ(
+                    quantizer, self.embedding_dim, 1024, 16, 8,
+                    faiss.METRIC_INNER_PRODUCT
+                )
+                index.nprobe = 16
+            else:
+                index = faiss.IndexFlatIP(self.embedding_dim)
+            self.faiss_index = index
+            self._pending = []
+            logger.info(
+                f"Initialized FAISS {ann_type} index with dimension {self.embedding_dim}"
+            )
         except Exception as e:
             logger.error(f"Failed to initialize FAISS index: {e}")
             self.faiss_index = None
@@ -283,25 +612,69 @@ class EmbeddingDuplicateDetector:
         """
         if not self.model or not content:
             return None
-        
+
+        key = _content_digest(content.encode('utf-8'))
+        cached = self._emb_cache.get(key)
+        if cached is not None:
+            self._emb_cache.move_to_end(key)
+            return cached
+
         try:
-            # Truncate content if too long (model limit)
-            max_length = 512  # Most sentence transformers have this limit
-            words = content.split()
-            if len(words) > max_length:
-                content = ' '.join(words[:max_length])
-            
             # Generate embedding
-            embedding = self.model.encode([content])[0]
-            
+            embedding = self.model.encode([self._truncate_content(content)])[0]
+
             # Normalize for cosine similarity
             embedding = embedding / np.linalg.norm(embedding)
-            
-            return embedding.astype(np.float32)
-            
+            embedding = embedding.astype(np.float32)
+
+            self._emb_cache[key] = embedding
+            if len(self._emb_cache) > self._emb_cache_size:
+                self._emb_cache.popitem(last=False)
+
+            return embedding
+
         except Exception as e:
             logger.error(f"Failed to generate embedding: {e}")
             return None
+
+    @staticmethod
+    def _truncate_content(content: str) -> str:
+        """Truncate content to the transformer's input budget."""
+        max_length = 512  # Most sentence transformers have this limit
+        words = content.split()
+        if len(words) > max_length:
+            return ' '.join(words[:max_length])
+        return content
+
+    def generate_embeddings(self, contents: List[str]) -> Optional[np.ndarray]:
+        """Generate embeddings for a batch of contents in one forward pass.
+
+        A single-sample encode leaves most of the matmul width idle;
+        batching amortizes it, so bulk ingest is bound by the model
+        rather than Python dispatch.
+
+        Args:
+            contents: Content texts
+
+        Returns:
+            (batch, dim) float32 matrix of normalized embeddings, or
+            None if the model is unavailable or encoding failed
+        """
+        if not self.model or not contents:
+            return None
+
+        try:
+            embeddings = self.model.encode(
+                [self._truncate_content(c) for c in contents],
+                batch_size=64,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            )
+            return embeddings.astype(np.float32)
+        except Exception as e:
+            logger.error(f"Failed to generate embeddings: {e}")
+            return None
     
     def generate_embedding_hash(self, embedding: np.ndarray) -> str:
         """Generate hash for embedding storage.
@@ -328,18 +701,57 @@ class EmbeddingDuplicateDetector:
         """
         if self.faiss_index is None or embedding is None:
             return
-        
+
         try:
-            # Add to FAISS index
-            embedding_2d = embedding.reshape(1, -1)
-            self.faiss_index.add(embedding_2d)
-            
-            # Map index to doc_id
-            index_id = self.faiss_index.ntotal - 1
-            self.doc_id_map[index_id] = doc_id
-            
+            self._add_with_ids([doc_id], embedding.reshape(1, -1))
         except Exception as e:
             logger.error(f"Failed to add embedding to index: {e}")
+
+    def add_batch_to_index(self, doc_ids: List[str], embeddings: np.ndarray):
+        """Add a batch of embeddings to the FAISS index in one call.
+
+        Args:
+            doc_ids: Document IDs, aligned with the embedding rows
+            embeddings: (batch, dim) float32 matrix
+        """
+        if self.faiss_index is None or embeddings is None or not len(embeddings):
+            return
+
+        try:
+            self._add_with_ids(list(doc_ids), embeddings)
+        except Exception as e:
+            logger.error(f"Failed to add embedding batch to index: {e}")
+
+    def _to_index_rows(self, embeddings: np.ndarray) -> np.ndarray:
+        """Convert embedding rows to the index's storage format."""
+        if self.quantize == 'binary':
+            return np.packbits(embeddings > 0, axis=1)
+        return embeddings
+
+    def _add_with_ids(self, doc_ids: List[str], embeddings: np.ndarray):
+        """Add rows to the index, keeping doc_id_map aligned.
+
+        An untrained IVFPQ index buffers rows until ivfpq_train_size
+        embeddings have accumulated, trains on them, then adds the whole
+        buffer; buffered rows are not searchable until then. Flat, HNSW
+        and binary indexes are always trained, so they take the direct
+        path.
+        """
+        embeddings = self._to_index_rows(embeddings)
+
+        if not self.faiss_index.is_trained:
+            self._pending.extend(zip(doc_ids, embeddings))
+            if len(self._pending) < self.ivfpq_train_size:
+                return
+            embeddings = np.stack([e for _, e in self._pending])
+            doc_ids = [d for d, _ in self._pending]
+            self.faiss_index.train(embeddings)
+            self._pending = []
+
+        start = self.faiss_index.ntotal
+        self.faiss_index.add(embeddings)
+        for offset, doc_id in enumerate(doc_ids):
+            self.doc_id_map[start + offset] = doc_id
     
     def find_embedding_duplicates(self, content: str, max_candidates: int = 100) -> List[Tuple[str, float]]:
         """Find near-duplicates using embeddings.
@@ -361,11 +773,18 @@ class EmbeddingDuplicateDetector:
         
         try:
             # Search FAISS index
-            embedding_2d = embedding.reshape(1, -1)
-            similarities, indices = self.faiss_index.search(embedding_2d, min(max_candidates, self.faiss_index.ntotal))
-            
+            embedding_2d = self._to_index_rows(embedding.reshape(1, -1))
+            scores, indices = self.faiss_index.search(
+                embedding_2d, min(max_candidates, self.faiss_index.ntotal)
+            )
+
+            # Binary indexes report Hamming distance in bits; map onto
+            # the same 0..1 similarity scale as inner product
+            if self.quantize == 'binary':
+                scores = 1.0 - scores / float(self.embedding_dim)
+
             candidates = []
-            for i, (similarity, index) in enumerate(zip(similarities[0], indices[0])):
+            for similarity, index in zip(scores[0], indices[0]):
                 if index in self.doc_id_map and similarity >= self.similarity_threshold:
                     doc_id = self.doc_id_map[index]
                     candidates.append((doc_id, float(similarity)))
@@ -513,7 +932,68 @@ class DeduplicationSystem:
             simhash=simhash,
             embedding_hash=embedding_hash
         )
-    
+
+        # Keep the in-memory structures in step with the DB
+        if exact_hash:
+            self.exact_detector.register_hash(exact_hash)
+        if simhash:
+            self.simhash_detector.add_hash(doc_id, simhash)
+
+    async def add_documents_bulk(self, doc_ids: List[str], contents: List[str]):
+        """Add a batch of documents to the deduplication indexes.
+
+        One encoder forward pass, one FAISS add and one DB transaction
+        cover the whole batch, instead of per-document model calls and
+        commits.
+
+        Args:
+            doc_ids: Document IDs
+            contents: Document contents, aligned with doc_ids
+        """
+        pairs = [(d, c) for d, c in zip(doc_ids, contents) if c]
+        if not pairs:
+            return
+
+        ids = [d for d, _ in pairs]
+        texts = [c for _, c in pairs]
+
+        exact_hashes = [
+            self.exact_detector.generate_content_hash(c) if self.exact_enabled else None
+            for c in texts
+        ]
+        simhashes = [
+            self.simhash_detector.generate_simhash(c) if self.simhash_enabled else None
+            for c in texts
+        ]
+
+        embedding_hashes = [None] * len(ids)
+        if self.embedding_enabled:
+            embeddings = self.embedding_detector.generate_embeddings(texts)
+            if embeddings is not None:
+                embedding_hashes = [
+                    self.embedding_detector.generate_embedding_hash(e)
+                    for e in embeddings
+                ]
+                self.embedding_detector.add_batch_to_index(ids, embeddings)
+
+        self.db_manager.add_deduplication_entries([
+            {
+                'doc_id': doc_id,
+                'exact_hash': exact_hash,
+                'simhash': simhash,
+                'embedding_hash': embedding_hash,
+            }
+            for doc_id, exact_hash, simhash, embedding_hash
+            in zip(ids, exact_hashes, simhashes, embedding_hashes)
+        ])
+
+        # Keep the in-memory structures in step with the DB
+        for doc_id, exact_hash, simhash in zip(ids, exact_hashes, simhashes):
+            if exact_hash:
+                self.exact_detector.register_hash(exact_hash)
+            if simhash:
+                self.simhash_detector.add_hash(doc_id, simhash)
+
     def get_duplicate_rate(self) -> float:
         """Get current duplicate detection rate."""
         if self.stats['total_checks'] == 0:
@@ -564,14 +1044,21 @@ class DeduplicationSystem:
         with self.db_manager.get_session() as session:
             from .models import DeduplicationIndex
             
-            # Delete old entries
+            # Delete old entries (the algorithm marker row is permanent)
             deleted = session.query(DeduplicationIndex).filter(
-                DeduplicationIndex.created_at < cutoff_date
+                DeduplicationIndex.created_at < cutoff_date,
+                DeduplicationIndex.doc_id != _SIMHASH_ALGO_MARKER
             ).delete()
             
             session.commit()
             logger.info(f"Cleaned up {deleted} old deduplication entries")
         
+        # Rebuild the in-memory structures without the deleted rows
+        if deleted > 0 and self.exact_enabled:
+            self.exact_detector.rebuild_filter()
+        if deleted > 0 and self.simhash_enabled:
+            self.simhash_detector.rebuild_cache()
+
         # Rebuild FAISS index if needed
         if deleted > 0 and self.embedding_enabled:
             await self._rebuild_faiss_index()
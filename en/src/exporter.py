@@ -2,6 +2,8 @@
 JSONL exporter with rotating shards and atomic operations.
 """
 import json
+import mmap
+import orjson
 import os
 import tempfile
 import shutil
@@ -207,15 +209,17 @@ class ShardManager:
 class JSONLExporter:
     """Main JSONL exporter with exactly-once semantics."""
     
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, output_dir: str = None, shard_size: int = None):
         """Initialize JSONL exporter.
-        
+
         Args:
             db_manager: Database manager instance
+            output_dir: Output directory for shards (defaults to config)
+            shard_size: Number of entries per shard (defaults to config)
         """
         self.db_manager = db_manager
-        self.output_dir = config.get('storage.shards_dir', './output')
-        self.shard_size = config.get('export.shard_size', 10000)
+        self.output_dir = output_dir or config.get('storage.shards_dir', './output')
+        self.shard_size = shard_size or config.get('export.shard_size', 10000)
         self.delivery_version = config.get('export.delivery_version', 'V1.0')
         
         self.shard_manager = ShardManager(self.output_dir, self.shard_size)
@@ -529,34 +533,44 @@ class JSONLExporter:
             results['file_size'] = shard_file.stat().st_size
             results['checksum'] = await self.shard_manager._calculate_file_checksum(shard_file)
             
-            # Validate JSON entries
-            async with aiofiles.open(shard_file, 'r', encoding='utf-8') as f:
-                line_number = 0
-                async for line in f:
-                    line_number += 1
-                    line = line.strip()
-                    
-                    if not line:
-                        continue
-                    
-                    try:
-                        entry_data = json.loads(line)
-                        
-                        # Validate required fields
-                        required_fields = ['id', 'text', 'meta', 'content_info']
-                        for field in required_fields:
-                            if field not in entry_data:
-                                results['errors'].append(f'missing_field_{field}_line_{line_number}')
-                        
-                        # Validate text length
-                        if len(entry_data.get('text', '')) < 200:
-                            results['errors'].append(f'text_too_short_line_{line_number}')
-                        
-                        results['entry_count'] += 1
-                        
-                    except json.JSONDecodeError as e:
-                        results['errors'].append(f'invalid_json_line_{line_number}: {e}')
-                        results['valid'] = False
+            # Validate JSON entries: mmap gives zero-copy access to the page
+            # cache and orjson parses each line slice natively, so memory
+            # stays flat regardless of shard size
+            if results['file_size'] > 0:
+                with open(shard_file, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    size = mm.size()
+                    line_number = 0
+                    start = 0
+                    while start < size:
+                        end = mm.find(b'\n', start)
+                        if end == -1:
+                            end = size
+                        line_number += 1
+                        line = mm[start:end].strip()
+                        start = end + 1
+
+                        if not line:
+                            continue
+
+                        try:
+                            entry_data = orjson.loads(line)
+
+                            # Validate required fields
+                            required_fields = ['id', 'text', 'meta', 'content_info']
+                            for field in required_fields:
+                                if field not in entry_data:
+                                    results['errors'].append(f'missing_field_{field}_line_{line_number}')
+
+                            # Validate text length
+                            if len(entry_data.get('text', '')) < 200:
+                                results['errors'].append(f'text_too_short_line_{line_number}')
+
+                            results['entry_count'] += 1
+
+                        except orjson.JSONDecodeError as e:
+                            results['errors'].append(f'invalid_json_line_{line_number}: {e}')
+                            results['valid'] = False
             
             if results['errors']:
                 results['valid'] = False
@@ -367,21 +367,23 @@ class AsyncFetcher:
 class FetcherPool:
     """Pool of fetcher workers for high-concurrency fetching."""
     
-    def __init__(self, pool_size: int = None):
+    def __init__(self, pool_size: int = None, concurrency: int = None):
         """Initialize fetcher pool.
-        
+
         Args:
             pool_size: Number of fetcher workers
+            concurrency: Total concurrency split across workers
         """
-        self.pool_size = pool_size or min(8, (config.get('crawler.concurrency', 64) // 8))
+        self.concurrency = concurrency or config.get('crawler.concurrency', 64)
+        self.pool_size = pool_size or min(8, (self.concurrency // 8))
         self.fetchers = []
         self.current_fetcher = 0
-        
+
     async def start(self):
         """Start all fetchers in the pool."""
         self.fetchers = []
         for i in range(self.pool_size):
-            fetcher = AsyncFetcher(concurrency=config.get('crawler.concurrency', 64) // self.pool_size)
+            fetcher = AsyncFetcher(concurrency=self.concurrency // self.pool_size)
             await fetcher.start()
             self.fetchers.append(fetcher)
         
@@ -7,7 +7,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.dialects.sqlite import JSON
 from datetime import datetime
 from typing import Optional, Dict, Any
-import json
+import orjson
 
 Base = declarative_base()
 
@@ -179,8 +179,8 @@ class DatabaseManager:
             state = session.query(SystemState).filter(SystemState.key == key).first()
             if state and state.value:
                 try:
-                    return json.loads(state.value)
-                except json.JSONDecodeError:
+                    return orjson.loads(state.value)
+                except orjson.JSONDecodeError:
                     return state.value
             return default
     
@@ -189,7 +189,7 @@ class DatabaseManager:
         with self.get_session() as session:
             state = session.query(SystemState).filter(SystemState.key == key).first()
             
-            value_str = json.dumps(value) if not isinstance(value, str) else value
+            value_str = orjson.dumps(value).decode() if not isinstance(value, str) else value
             
             if state:
                 state.value = value_str
@@ -301,7 +301,17 @@ class DatabaseManager:
             )
             session.add(dedupe)
             session.commit()
-    
+
+    def add_deduplication_entries(self, entries: list):
+        """Add multiple deduplication entries in one transaction.
+
+        Args:
+            entries: Dicts of DeduplicationIndex column values
+        """
+        with self.get_session() as session:
+            session.add_all([DeduplicationIndex(**entry) for entry in entries])
+            session.commit()
+
     def update_crawl_stats(self, date: str, domain: str, **stats):
         """Update crawl statistics."""
         with self.get_session() as session:
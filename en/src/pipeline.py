@@ -59,34 +59,68 @@ class PipelineStats:
         return self.duplicates_found / self.content_allowed
 
 
+@dataclass(frozen=True, slots=True)
+class RunOptions:
+    """Immutable per-run overrides resolved once at CLI startup.
+
+    The CLI used to push overrides by mutating the shared config dict in
+    place; instead the resolved values travel here and are stored as plain
+    attributes on the pipeline, so hot paths never re-resolve dotted
+    config keys. Unset fields fall back to config defaults.
+    """
+    concurrency: Optional[int] = None
+    shard_size: Optional[int] = None
+    shards_dir: Optional[str] = None
+    max_pages: Optional[int] = None
+    max_time_hours: Optional[int] = None
+    seeds: Optional[tuple] = None
+
+
 class CrawlingPipeline:
     """Main crawling pipeline orchestrator."""
-    
-    def __init__(self, database_url: str = None):
+
+    def __init__(self, database_url: str = None, options: RunOptions = None,
+                 db_manager: DatabaseManager = None):
         """Initialize crawling pipeline.
-        
+
         Args:
             database_url: Database connection URL
+            options: Per-run overrides; unset fields fall back to config
+            db_manager: Existing DatabaseManager to reuse instead of
+                building a new engine/pool
         """
-        # Initialize database
-        if database_url is None:
-            db_config = config.get_database_config()
-            if db_config.get('type') == 'sqlite':
-                database_url = f"sqlite:///{db_config['sqlite']['path']}"
-            else:
-                database_url = "sqlite:///./data/crawler.db"
-        
-        self.db_manager = DatabaseManager(database_url)
+        self.options = options or RunOptions()
+
+        # Resolve run settings once; hot paths read these attributes directly
+        self.concurrency = self.options.concurrency or config.get('crawler.concurrency', 64)
+        self.shard_size = self.options.shard_size or config.get('export.shard_size', 10000)
+        self.shards_dir = self.options.shards_dir or config.get('storage.shards_dir', './output')
+        self.seed_urls = list(self.options.seeds) if self.options.seeds else None
+
+        # Initialize database (reuse an injected manager when given)
+        if db_manager is not None:
+            self.db_manager = db_manager
+        else:
+            if database_url is None:
+                db_config = config.get_database_config()
+                if db_config.get('type') == 'sqlite':
+                    database_url = f"sqlite:///{db_config['sqlite']['path']}"
+                else:
+                    database_url = "sqlite:///./data/crawler.db"
+
+            self.db_manager = DatabaseManager(database_url)
         self.db_manager.create_tables()
         
         # Initialize components
         self.frontier_manager = FrontierManager(self.db_manager)
-        self.fetcher_pool = FetcherPool()
+        self.fetcher_pool = FetcherPool(concurrency=self.concurrency)
         self.content_extractor = ContentExtractor()
         self.content_cleaner = ContentCleaner()
         self.topic_classifier = TopicClassifier()
         self.deduplication_system = DeduplicationSystem(self.db_manager)
-        self.jsonl_exporter = JSONLExporter(self.db_manager)
+        self.jsonl_exporter = JSONLExporter(
+            self.db_manager, output_dir=self.shards_dir, shard_size=self.shard_size
+        )
         
         # Pipeline state
         self.running = False
@@ -139,7 +173,7 @@ class CrawlingPipeline:
         frontier_stats = self.frontier_manager.get_frontier_stats()
         
         if frontier_stats.get('total_urls', 0) == 0:
-            seed_urls = config.get_domain_seeds()
+            seed_urls = self.seed_urls or config.get_domain_seeds()
             if seed_urls:
                 await self.frontier_manager.seed_frontier(seed_urls)
                 logger.info(f"Seeded frontier with {len(seed_urls)} URLs")